@@ -0,0 +1,150 @@
+"""Perhitungan rekomendasi SAW untuk halaman "Can I Afford To Buy This?".
+
+Murni Python, tanpa pandas/matplotlib/Google client, agar halaman ini tetap
+ringan saat di-render ulang.
+"""
+import math
+
+# Bobot SAW per kriteria; bobot lain boleh dipakai, akan dinormalisasi ke total 1
+BOBOT = {"afford": 0.6, "bahagia": 0.15, "penting": 0.25}
+# Kriteria di bawah batas ini memunculkan peringatan; "psikologis" = rata-rata bahagia & penting
+BATAS_PERINGATAN = {"afford": 0.90, "bahagia": 0.60, "penting": 0.60, "psikologis": 0.65}
+PESAN_PERINGATAN = {
+    "afford": "⚠️ Harga barang lebih dari 10% tabungan Anda.",
+    "bahagia": "⚠️ Tingkat kebahagiaan Anda relatif rendah.",
+    "penting": "⚠️ Tingkat kepentingan barang relatif rendah.",
+    "psikologis": "⚠️ Skor psikologis gabungan rendah, pertimbangkan ulang keputusan pembelian.",
+}
+BATAS_SKOR = 0.75  # skor minimal untuk rekomendasi membeli
+KELIPATAN_TABUNGAN = 10  # tabungan aman = harga barang x kelipatan ini
+MAX_BULAN = 1200  # batas simulasi jika target ikut naik karena inflasi (100 tahun)
+TITIK_GRAFIK = 120  # jumlah titik maksimum grafik simulasi, berapa pun lamanya
+MILESTONE = (0.25, 0.5, 0.75, 1.0)
+
+
+def format_rupiah(value):
+    return f"{value:,}".replace(",", ".")
+
+
+def parse_rupiah(text):
+    try:
+        return int(text.replace(".", "").strip())
+    except:
+        return 0
+
+
+def normalisasi_bobot(bobot=None):
+    """Validasi bobot SAW dan skalakan agar totalnya 1 (skor tetap di 0–1)."""
+    if bobot is None:
+        return dict(BOBOT)
+    if set(bobot) != set(BOBOT):
+        raise ValueError(f"bobot harus berisi tepat {sorted(BOBOT)}, bukan {sorted(bobot)}")
+    if any(b < 0 for b in bobot.values()):
+        raise ValueError("bobot tidak boleh negatif")
+    total = sum(bobot.values())
+    if total <= 0:
+        raise ValueError("total bobot harus lebih dari 0")
+    return {k: b / total for k, b in bobot.items()}
+
+
+def saw_rekomendasi(uang_sekarang, harga_barang, bahagia, penting, bobot=None):
+    bobot = normalisasi_bobot(bobot)
+    if uang_sekarang > 0:
+        affordability = harga_barang / uang_sekarang
+    else:
+        affordability = 1e9
+
+    n_afford = min(1 / affordability, 1)
+    n_bahagia = bahagia / 100
+    n_penting = penting / 100
+
+    skor = n_afford * bobot["afford"] + n_bahagia * bobot["bahagia"] + n_penting * bobot["penting"]
+    tabungan_minimal = harga_barang * KELIPATAN_TABUNGAN
+
+    return skor, n_afford, n_bahagia, n_penting, tabungan_minimal
+
+
+def peringatan(n_afford, n_bahagia, n_penting):
+    nilai = {
+        "afford": n_afford,
+        "bahagia": n_bahagia,
+        "penting": n_penting,
+        "psikologis": (n_bahagia + n_penting)/2,
+    }
+    return [PESAN_PERINGATAN[k] for k, batas in BATAS_PERINGATAN.items() if nilai[k] < batas]
+
+
+# ===================== Simulasi Tabungan =====================
+def laju_bulanan(persen_tahunan):
+    """Laju majemuk bulanan dari persentase tahunan (bunga atau inflasi)."""
+    return (1 + persen_tahunan / 100) ** (1 / 12) - 1
+
+
+def saldo_bulan(saldo_awal, setoran, bulan, bunga=0.0):
+    """Saldo setelah ``bulan`` kali setoran akhir bulan dengan bunga majemuk bulanan."""
+    if bunga == 0:
+        return saldo_awal + setoran * bulan
+    tumbuh = (1 + bunga) ** bulan
+    return saldo_awal * tumbuh + setoran * (tumbuh - 1) / bunga
+
+
+def target_bulan(target, bulan, inflasi=0.0):
+    return target * (1 + inflasi) ** bulan
+
+
+def bulan_mencapai(saldo_awal, setoran, target, bunga=0.0, inflasi=0.0):
+    """Bulan pertama saldo >= target; ``None`` jika tidak pernah tercapai.
+
+    Tanpa inflasi dihitung langsung (closed form). Dengan inflasi target ikut
+    naik dan dicari paling jauh ``MAX_BULAN`` bulan.
+    """
+    if saldo_awal >= target:
+        return 0
+    if inflasi == 0:
+        if bunga == 0:
+            if setoran <= 0:
+                return None
+            # Target milestone berupa float; bulan tetap bilangan bulat
+            return int(-(-(target - saldo_awal) // setoran))
+        # saldo(n) + c = (saldo_awal + c) * (1 + bunga)^n, dengan c = setoran / bunga
+        c = setoran / bunga
+        if saldo_awal + c <= 0:
+            return None
+        bulan = math.ceil(math.log((target + c) / (saldo_awal + c)) / math.log(1 + bunga))
+        # Koreksi galat pembulatan float di sekitar batas bulan
+        while bulan > 0 and saldo_bulan(saldo_awal, setoran, bulan - 1, bunga) >= target:
+            bulan -= 1
+        while saldo_bulan(saldo_awal, setoran, bulan, bunga) < target:
+            bulan += 1
+        return bulan
+    for bulan in range(1, MAX_BULAN + 1):
+        if saldo_bulan(saldo_awal, setoran, bulan, bunga) >= target_bulan(target, bulan, inflasi):
+            return bulan
+    return None
+
+
+def simulasi_tabungan(saldo_awal, setoran, target, bunga_tahunan=0.0, inflasi_tahunan=0.0):
+    """Ringkasan simulasi: bulan tercapai, milestone, dan titik grafik.
+
+    Jumlah titik grafik dibatasi ``TITIK_GRAFIK`` sehingga waktu render tidak
+    bergantung pada berapa bulan yang dibutuhkan.
+    """
+    bunga = laju_bulanan(bunga_tahunan)
+    inflasi = laju_bulanan(inflasi_tahunan)
+    bulan = bulan_mencapai(saldo_awal, setoran, target, bunga, inflasi)
+
+    milestone = []
+    for porsi in MILESTONE:
+        n = bulan_mencapai(saldo_awal, setoran, target * porsi, bunga, inflasi)
+        if n is not None:
+            milestone.append((porsi, n, saldo_bulan(saldo_awal, setoran, n, bunga)))
+
+    horizon = bulan if bulan is not None else MAX_BULAN
+    langkah = max(1, math.ceil(horizon / TITIK_GRAFIK))
+    titik = [
+        {"bulan": n,
+         "tabungan": round(saldo_bulan(saldo_awal, setoran, n, bunga)),
+         "target": round(target_bulan(target, n, inflasi))}
+        for n in sorted(set(range(0, horizon, langkah)) | {horizon})
+    ]
+    return {"bulan": bulan, "milestone": milestone, "titik": titik}
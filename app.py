@@ -1,19 +1,12 @@
 from __future__ import print_function
 from streamlit_option_menu import option_menu
-import os.path
-import base64
-import re
-import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from bs4 import BeautifulSoup
-from email.utils import parsedate_to_datetime
+import time
 from datetime import datetime, timedelta
 
+# Modul berat (pandas, matplotlib, Google client) di-import di dalam halaman
+# yang memakainya, supaya Home dan halaman lain tetap cepat dimuat.
+
 # ===================== Konfigurasi Halaman =====================
 st.set_page_config(page_title="Finance App", layout="wide")
 
@@ -86,124 +79,81 @@ if selected == "Home":
 # ===================== Halaman Finance Tracker =====================
 elif selected == "Finance Tracker":
     # ===================== Konfigurasi =====================
-    SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
     ALLOWED_SENDERS = [
         "noreply.livin@bankmandiri.co.id",
         "bca@bca.co.id"
     ]
+    FETCH_WORKERS = 8  # jumlah pesan yang diambil bersamaan dari Gmail
+    STORE_PATH = "transactions.db"  # penyimpanan lokal transaksi yang sudah diambil
+    ARCHIVE_PATH = "archive"  # arsip email mentah, untuk parse ulang tanpa unduh lagi (python -m tracker.reparse)
+    CHART_BACKEND = "matplotlib"  # "native" = grafik bawaan Streamlit, tanpa matplotlib
+    DAILY_CHART_MAX_DAYS = 92  # rentang lebih panjang dari ini digrafikkan per bulan
+    PREVIEW_INTERVAL = 2.0  # detik minimal antar pembaruan pratinjau selama sinkronisasi
 
     # ===================== Helper =====================
-    def get_service():
-        creds = None
-        try:
-            if os.path.exists('token.json'):
-                creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-                    creds = flow.run_local_server(port=0)
-                with open('token.json', 'w') as token:
-                    token.write(creds.to_json())
-        except Exception as e:
-            if os.path.exists('token.json'):
-                os.remove('token.json')
-            st.warning("⚠️ Token Gmail kadaluarsa atau dicabut. Silakan login ulang.")
-            flow = InstalledAppFlow.from_client_secrets_file('credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
-
-        return build('gmail', 'v1', credentials=creds)
-
-    def extract_email_text(msg):
-        parts = msg.get("payload", {}).get("parts", [])
-        text = ""
-        if not parts:
-            data = msg['payload']['body'].get('data', '')
-            text = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-        else:
-            for part in parts:
-                if part.get("mimeType") == "text/plain":
-                    data = part['body'].get('data', '')
-                    text += base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-                elif part.get("mimeType") == "text/html":
-                    data = part['body'].get('data', '')
-                    html = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-                    soup = BeautifulSoup(html, "html.parser")
-                    text += soup.get_text()
-        return text
-
-    def normalize_amount(amount_str):
-        if "," in amount_str and "." in amount_str and amount_str.find(",") < amount_str.find("."):
-            amount_str = amount_str.replace(",", "")
-        else:
-            amount_str = amount_str.replace(".", "").replace(",", ".")
-        return float(amount_str)
+    from tracker.metrics import METRICS
+    from tracker.ui import render_table, render_preview, render_summary, render_charts, render_metrics
 
-    def format_rupiah(amount):
-        return f"Rp {amount:,.0f}".replace(",", ".")
+    def get_credentials():
+        from tracker.gmail import load_credentials
+        return load_credentials('token.json', 'credentials.json',
+                                on_reset=lambda: st.warning("⚠️ Token Gmail kadaluarsa atau dicabut. Silakan login ulang."))
 
     # ===================== Ambil transaksi =====================
-    @st.cache_data(ttl=300)
-    def get_transactions_from_gmail(selected_senders, start_date, end_date, max_results=200):
-        service = get_service()
-        
-        query_senders = " OR ".join([f"from:{sender}" for sender in selected_senders])
-        query_dates = f"after:{start_date.strftime('%Y/%m/%d')} before:{(end_date+timedelta(days=1)).strftime('%Y/%m/%d')}"
-        query = f"({query_senders}) {query_dates}"
-
-        results = service.users().messages().list(
-            userId='me',
-            maxResults=max_results,
-            q=query
-        ).execute()
-
-        messages = results.get('messages', [])
-        transactions = []
-
-        for msg_item in messages:
-            txt = service.users().messages().get(userId='me', id=msg_item['id']).execute()
-            headers = txt.get("payload", {}).get("headers", [])
-            sender = next((h["value"] for h in headers if h["name"].lower()=="from"), "")
-            date_header = next((h["value"] for h in headers if h["name"].lower()=="date"), "")
-            subject = next((h["value"] for h in headers if h["name"].lower()=="subject"), "")
-
-            text = extract_email_text(txt).replace("\xa0", " ").replace("\t", " ")
-
-            amount_match = re.search(r'(?:Rp|IDR)\s*([\d]{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})?)', text, re.IGNORECASE)
-            if not amount_match:
-                continue
-            try:
-                amount = normalize_amount(amount_match.group(1))
-            except:
-                continue
-
-            search_text = (subject + " " + text).lower()
-            if re.search(r'\b(masuk|diterima|transfer masuk|deposit|top up)\b', search_text):
-                tipe = "Pendapatan"
-            elif re.search(r'\b(keluar|pembayaran|berhasil dibayar|transfer keluar|purchase|withdrawal|transaction|pembelian|tagihan|transfer berhasil|penarikan|qris|top-up)\b', search_text):
-                tipe = "Pengeluaran"
-            else:
-                tipe = "Tidak diketahui"
-
-            transactions.append({
-                "tanggal": parsedate_to_datetime(date_header),
-                "tipe": tipe,
-                "amount": amount,
-                "jumlah transaksi": format_rupiah(amount),
-                "pengirim": sender
-            })
-
-        df = pd.DataFrame(transactions)
-        if not df.empty:
-            df = df.sort_values(by="tanggal", ascending=False)
-        return df
+    @st.cache_resource
+    def get_gmail_client():
+        from tracker.gmail import GmailClient
+        # Satu klien untuk semua sesi; token di-refresh sendiri di background
+        client = GmailClient(get_credentials(), token_path='token.json')
+        METRICS.register_collector("quota", lambda: dict(client.scheduler.stats, rate=round(client.scheduler.rate, 1)))
+        return client
+
+    @st.cache_resource
+    def get_store():
+        from tracker.store import TransactionStore
+        store = TransactionStore(STORE_PATH)
+        METRICS.register_collector("day_cache", store.cache.stats)
+        return store
+
+    @st.cache_resource
+    def get_archive():
+        from tracker.archive import MessageArchive
+        return MessageArchive(ARCHIVE_PATH)
+
+    def sync_from_gmail(selected_senders, start_date, end_date):
+        """Yield progres ``(selesai, total)`` selama pesan baru diambil ke store lokal."""
+        store = get_store()
+        # Gmail hanya dihubungi jika ada rentang tanggal yang belum tersimpan lokal
+        if not any(store.missing_ranges(sender, start_date, end_date) for sender in selected_senders):
+            return
+        from google.auth.exceptions import RefreshError
+        from googleapiclient.errors import HttpError
+        from httplib2 import HttpLib2Error
+        from tracker.fetch import iter_sync
+
+        client = get_gmail_client()
+        try:
+            yield from iter_sync(client.service, store, selected_senders, start_date, end_date,
+                                 max_workers=FETCH_WORKERS, http_factory=client.http, archive=get_archive(),
+                                 scheduler=client.scheduler)
+        except HttpError as e:
+            # Retry sudah habis; transaksi yang sudah diambil tetap tersimpan dan ditampilkan
+            st.warning(f"⚠️ Gmail sedang membatasi/menolak request ({e.resp.status}). "
+                       "Data yang sudah diambil tetap ditampilkan; terapkan filter lagi nanti untuk melanjutkan.")
+        except (ConnectionError, TimeoutError, HttpLib2Error) as e:
+            # Jaringan putus/timeout setelah retry habis, atau server tidak ditemukan (tidak di-retry)
+            st.warning(f"⚠️ Koneksi ke Gmail gagal ({type(e).__name__}). "
+                       "Data yang sudah diambil tetap ditampilkan; terapkan filter lagi nanti untuk melanjutkan.")
+        except RefreshError:
+            # Token dicabut setelah klien dibuat; buang klien agar login ulang di percobaan berikutnya
+            client.close()
+            get_gmail_client.clear()
+            st.warning("⚠️ Token Gmail kadaluarsa atau dicabut. Terapkan filter lagi untuk login ulang.")
 
     # ===================== Streamlit UI =====================
     st.title("💰 Finance Tracker")
     st.markdown("Pantau transaksi keuangan Anda dengan cepat dan rapi.")
+    show_metrics = st.sidebar.toggle("🛠️ Debug metrik", value=False)
 
     # --- Filter UI ---
     with st.container():
@@ -211,7 +161,8 @@ elif selected == "Finance Tracker":
         col_date, col_sender, col_button = st.columns([3,4,1])
 
         today = datetime.today().date()
-        min_allowed = today - timedelta(days=365)
+        # Ringkasan & grafik dibaca dari rollup, jadi rentang bertahun-tahun tetap ringan
+        min_allowed = datetime(2004, 4, 1).date()  # Gmail mulai dipakai April 2004
 
         with col_date:
             date_range = st.date_input(
@@ -232,108 +183,54 @@ elif selected == "Finance Tracker":
             apply_filter = st.button("Terapkan Filter")
 
     # --- Ambil data hanya setelah filter ditekan ---
-    df_filtered = pd.DataFrame()
     if apply_filter:
         if not selected_senders:
             st.warning("⚠️ Silakan pilih minimal satu pengirim.")
         else:
             start_date, end_date = date_range
-            with st.spinner("Mengambil data transaksi dari Gmail..."):
-                df_filtered = get_transactions_from_gmail(selected_senders, start_date, end_date)
+            store = get_store()
+            progress_slot = st.empty()
+            table_slot = st.empty()
+            summary_slot = st.empty()
+
+            # Pratinjau tanpa Styler di potongan pertama lalu paling sering tiap PREVIEW_INTERVAL;
+            # membaca ulang seluruh rentang di setiap potongan membuat biaya naik kuadratik
+            last_preview = None
+            for selesai, total in sync_from_gmail(selected_senders, start_date, end_date):
+                progress_slot.progress(selesai / total, text=f"Mengambil transaksi dari Gmail... {selesai}/{total} email")
+                if last_preview is not None and time.monotonic() - last_preview < PREVIEW_INTERVAL:
+                    continue
+                preview = store.query(selected_senders, start_date, end_date)
+                if not preview.empty:
+                    with table_slot.container():
+                        render_preview(preview)
+                    with summary_slot.container():
+                        render_summary(store.rollup(selected_senders, start_date, end_date, "month"))
+                last_preview = time.monotonic()
+            progress_slot.empty()
+            METRICS.log_snapshot("sync")
+
+            # Tabel lengkap dengan format hanya dirender sekali, setelah sinkronisasi selesai
+            df_filtered = store.query(selected_senders, start_date, end_date)
 
             if df_filtered.empty:
                 st.info("Tidak ada transaksi pada rentang tanggal & pengirim yang dipilih.")
             else:
-                df_filtered['tanggal'] = df_filtered['tanggal'].dt.strftime('%d/%m/%Y')
-
-                def color_tipe(val):
-                    if val == "Pendapatan":
-                        return "color: green"
-                    elif val == "Pengeluaran":
-                        return "color: red"
-                    return ""
-
-                styled_df = df_filtered[['tanggal','tipe','jumlah transaksi','pengirim']].style \
-                    .applymap(color_tipe, subset=['tipe']) \
-                    .set_table_styles([{'selector': 'th','props': [('text-align', 'center'),('font-weight', 'bold')]}])
-
-                st.subheader("📊 Data Transaksi")
-                st.dataframe(styled_df, use_container_width=True)
+                with table_slot.container():
+                    render_table(df_filtered)
 
                 # ===================== Ringkasan Keuangan =====================
-                st.subheader("Ringkasan Keuangan")
-                total_pendapatan = df_filtered[df_filtered['tipe']=="Pendapatan"]['amount'].sum()
-                total_pengeluaran = df_filtered[df_filtered['tipe']=="Pengeluaran"]['amount'].sum()
-                saldo = total_pendapatan - total_pengeluaran
-
-                # Tampilkan dalam 3 kolom sejajar
-                col1, col2, col3 = st.columns(3)
-                col1.metric("Total Pendapatan", format_rupiah(total_pendapatan))
-                col2.metric("Total Pengeluaran", format_rupiah(total_pengeluaran))
-                col3.metric("Saldo", format_rupiah(saldo))
+                period = "day" if (end_date - start_date).days < DAILY_CHART_MAX_DAYS else "month"
+                rollup = store.rollup(selected_senders, start_date, end_date, period)
+                with summary_slot.container():
+                    total_pendapatan, total_pengeluaran = render_summary(rollup)
 
                 # ===================== Grafik =====================
-                st.subheader("📈 Grafik Keuangan")
-
-                # Buat 3 kolom untuk menampung masing-masing grafik
-                col1, col2, col3 = st.columns(3)
-
-                # ================= Grafik Seragam =================
-                # Atur kolom supaya ketiga grafik sejajar
-                col1, col2, col3 = st.columns([1, 1, 1])
-
-                # Grafik 1: Bar Pendapatan & Pengeluaran
-                with col1:
-                    fig, ax = plt.subplots(figsize=(4,3))
-                    fig.patch.set_facecolor("#1f1f1f")  # gelap tapi netral
-                    ax.set_facecolor("#1f1f1f")
-                    ax.bar(['Pendapatan', 'Pengeluaran'], [total_pendapatan, total_pengeluaran], color=["#285A2A", '#621A15'])
-                    ax.set_ylabel("Jumlah (Rp)", color='white')
-                    ax.set_title("Pendapatan vs Pengeluaran", color='white')
-                    ax.tick_params(colors='white', labelsize=10)
-                    ax.grid(True, linestyle='--', alpha=0.3, color='white')
-                    for spine in ax.spines.values():
-                        spine.set_visible(False)
-                    st.pyplot(fig, clear_figure=False)
-
-                # Grafik 2: Pie tipe transaksi
-                with col2:
-                    tipe_counts = df_filtered['tipe'].value_counts()
-                    fig2, ax2 = plt.subplots(figsize=(4,3))
-                    fig2.patch.set_facecolor("#1f1f1f")
-                    ax2.set_facecolor("#1f1f1f")
-                    wedges, texts, autotexts = ax2.pie(
-                        tipe_counts, labels=tipe_counts.index, autopct='%1.1f%%', startangle=90,
-                        colors=["#621A15",'#285A2A','#2196F3'],
-                        textprops={'color':'white', 'fontsize':10}
-                    )
-                    ax2.axis('equal')
-                    ax2.set_title("Distribusi Tipe Transaksi", color='white')
-                    st.pyplot(fig2, clear_figure=True)
-
-                # Grafik 3: Line chart pengeluaran harian
-                with col3:
-                    pengeluaran_df = df_filtered[df_filtered['tipe'] == "Pengeluaran"].copy()
-                    if not pengeluaran_df.empty:
-                        pengeluaran_df['tanggal'] = pd.to_datetime(pengeluaran_df['tanggal'], dayfirst=True, errors='coerce')
-                        pengeluaran_df = pengeluaran_df.dropna(subset=['tanggal'])
-                        pengeluaran_daily = pengeluaran_df.groupby(pengeluaran_df['tanggal'].dt.date)['amount'].sum().reset_index()
-
-                        fig3, ax3 = plt.subplots(figsize=(4,3))
-                        fig3.patch.set_facecolor("#1f1f1f")
-                        ax3.set_facecolor("#1f1f1f")
-                        ax3.plot(pengeluaran_daily['tanggal'], pengeluaran_daily['amount'], marker='o', linestyle='-', color='#621A15', linewidth=2)
-                        ax3.set_xlabel("Tanggal", color='white')
-                        ax3.set_ylabel("Jumlah (Rp)", color='white')
-                        ax3.set_title("Pengeluaran Harian", color='white')
-                        ax3.tick_params(axis='x', colors='white', rotation=45)
-                        ax3.tick_params(axis='y', colors='white')
-                        ax3.grid(True, linestyle='--', alpha=0.3, color='white')
-                        for spine in ax3.spines.values():
-                            spine.set_visible(False)
-                        st.pyplot(fig3, clear_figure=True)
-                    else:
-                        st.info("Tidak ada data pengeluaran untuk periode ini.")
+                render_charts(rollup, total_pendapatan, total_pengeluaran, period=period, backend=CHART_BACKEND)
+
+    # --- Panel debug, digambar terakhir agar mencakup semua tahap di rerun ini ---
+    if show_metrics:
+        render_metrics()
 
 
 # ===================== Halaman Can I Afford To Buy This =====================
@@ -351,35 +248,14 @@ elif selected == "Can I Afford To Buy This?":
 
         st.subheader("Simulasi Tabungan")
         tabungan_perbulan_str = st.text_input("Jumlah menabung per bulan dalam rupiah (Optional)", value="")
+        col_bunga, col_inflasi = st.columns(2)
+        with col_bunga:
+            bunga_tahunan = st.number_input("Imbal hasil tabungan per tahun (%) (Optional)", min_value=0.0, max_value=100.0, value=0.0, step=0.5)
+        with col_inflasi:
+            inflasi_tahunan = st.number_input("Kenaikan harga / inflasi per tahun (%) (Optional)", min_value=0.0, max_value=100.0, value=0.0, step=0.5)
 
         # ---------------- Helper Functions ----------------
-        def format_rupiah(value):
-            return f"{value:,}".replace(",", ".")
-
-        def parse_rupiah(text):
-            try:
-                return int(text.replace(".", "").strip())
-            except:
-                return 0
-
-        def saw_rekomendasi(uang_sekarang, harga_barang, bahagia, penting):
-            if uang_sekarang > 0:
-                affordability = harga_barang / uang_sekarang
-            else:
-                affordability = 1e9
-
-            n_afford = min(1 / affordability, 1)
-            n_bahagia = bahagia / 100
-            n_penting = penting / 100
-
-            bobot_afford = 0.6
-            bobot_bahagia = 0.15
-            bobot_penting = 0.25
-
-            skor = n_afford * bobot_afford + n_bahagia * bobot_bahagia + n_penting * bobot_penting
-            tabungan_minimal = harga_barang * 10
-
-            return skor, n_afford, n_bahagia, n_penting, tabungan_minimal
+        from afford import BATAS_SKOR, BOBOT, MAX_BULAN, format_rupiah, parse_rupiah, saw_rekomendasi, peringatan, simulasi_tabungan
 
         # ================= Hasil Rekomendasi =================
         if st.button("🔍 Lihat Rekomendasi"):
@@ -392,22 +268,13 @@ elif selected == "Can I Afford To Buy This?":
             st.subheader("📌 Hasil Rekomendasi")
             st.write(f"- Skor Akhir: {skor:.2f} (0–1)")
 
-            if skor >= 0.75:
+            if skor >= BATAS_SKOR:
                 st.success("✅ Rekomendasi: Anda dapat membeli barang ini.")
             else:
                 st.error("❌ Rekomendasi: Sebaiknya tunda dulu pembelian.")
                 st.info(f"💡 Agar aman secara finansial, sebaiknya punya uang minimal: Rp {format_rupiah(tabungan_minimal)}")
 
-            warnings = []
-            if n_afford < 0.90:
-                warnings.append("⚠️ Harga barang lebih dari 10% tabungan Anda.")
-            if n_bahagia < 0.60:
-                warnings.append("⚠️ Tingkat kebahagiaan Anda relatif rendah.")
-            if n_penting < 0.60:
-                warnings.append("⚠️ Tingkat kepentingan barang relatif rendah.")
-            if (n_bahagia + n_penting)/2 < 0.65:
-                warnings.append("⚠️ Skor psikologis gabungan rendah, pertimbangkan ulang keputusan pembelian.")
-
+            warnings = peringatan(n_afford, n_bahagia, n_penting)
             if warnings:
                 st.write("### ⚠️ Peringatan")
                 for w in warnings:
@@ -420,21 +287,67 @@ elif selected == "Can I Afford To Buy This?":
             st.write(f"🎯 Target tabungan aman: Rp {format_rupiah(tabungan_minimal)}")
 
             if tabungan_perbulan > 0:
-                sisa = tabungan_minimal - uang_sekarang
-                if sisa <= 0:
+                if uang_sekarang >= tabungan_minimal:
                     st.success("✅ Tabungan Anda sudah mencukupi untuk kondisi aman.")
                 else:
-                    bulan_diperlukan = -(-sisa // tabungan_perbulan)
-                    st.info(f"Anda perlu menabung sekitar {bulan_diperlukan} bulan lagi untuk mencapai tabungan aman.")
-
-                    saldo = uang_sekarang
-                    for bulan in range(1, bulan_diperlukan + 1):
-                        saldo += tabungan_perbulan
-                        progress = min(saldo / tabungan_minimal, 1.0)
-                        st.progress(progress, text=f"Bulan {bulan}: Rp {format_rupiah(saldo)}")
+                    # Satu grafik + tabel milestone; jumlah elemen tetap berapa pun lamanya
+                    simulasi = simulasi_tabungan(uang_sekarang, tabungan_perbulan, tabungan_minimal,
+                                                 bunga_tahunan, inflasi_tahunan)
+                    bulan_diperlukan = simulasi["bulan"]
+                    if bulan_diperlukan is None:
+                        st.error(f"❌ Dengan setoran ini target tidak tercapai dalam {MAX_BULAN // 12} tahun, karena harga naik lebih cepat dari tabungan.")
+                    else:
+                        st.info(f"Anda perlu menabung sekitar {bulan_diperlukan} bulan lagi untuk mencapai tabungan aman.")
+
+                    st.vega_lite_chart({
+                        "data": {"values": simulasi["titik"]},
+                        "transform": [{"fold": ["tabungan", "target"], "as": ["seri", "rupiah"]}],
+                        "mark": {"type": "line", "point": len(simulasi["titik"]) <= 24},
+                        "encoding": {
+                            "x": {"field": "bulan", "type": "quantitative", "title": "Bulan"},
+                            "y": {"field": "rupiah", "type": "quantitative", "title": "Rp"},
+                            "color": {"field": "seri", "type": "nominal", "title": None},
+                        },
+                    }, use_container_width=True)
+
+                    if simulasi["milestone"]:
+                        baris = [f"| {porsi:.0%} | {bulan} | Rp {format_rupiah(round(saldo))} |"
+                                 for porsi, bulan, saldo in simulasi["milestone"]]
+                        st.markdown("| Milestone | Bulan ke- | Tabungan |\n|---|---|---|\n" + "\n".join(baris))
             else:
                 st.warning("⚠️ Masukkan jumlah tabungan per bulan untuk simulasi.")
 
+    # ================= Evaluasi Wishlist =================
+    with st.expander("📋 Evaluasi Wishlist (CSV)"):
+        st.caption("Kolom CSV: nama (opsional), harga, bahagia (0–100), penting (0–100). "
+                   "Memakai uang yang dimiliki sekarang dari isian di atas.")
+        wishlist_file = st.file_uploader("Upload wishlist", type=["csv"])
+        col_afford, col_bahagia, col_penting = st.columns(3)
+        bobot = {
+            "afford": col_afford.number_input("Bobot keterjangkauan", min_value=0.0, value=BOBOT["afford"], step=0.05),
+            "bahagia": col_bahagia.number_input("Bobot kebahagiaan", min_value=0.0, value=BOBOT["bahagia"], step=0.05),
+            "penting": col_penting.number_input("Bobot kepentingan", min_value=0.0, value=BOBOT["penting"], step=0.05),
+        }
+
+        if wishlist_file is not None:
+            # pandas hanya dimuat jika wishlist benar-benar dipakai
+            from wishlist import baca_wishlist, nilai_wishlist
+            try:
+                hasil = nilai_wishlist(baca_wishlist(wishlist_file), parse_rupiah(uang_str), bobot)
+            except ValueError as e:
+                st.error(f"❌ Wishlist tidak valid: {e}")
+            else:
+                st.write(f"{int(hasil['layak_beli'].sum())} dari {len(hasil)} barang layak dibeli sekarang.")
+                kolom = [k for k in ["peringkat", "nama", "harga", "skor", "layak_beli", "tabungan_minimal", "jumlah_peringatan"] if k in hasil]
+                st.dataframe(
+                    hasil[kolom].style.format({
+                        "harga": lambda v: f"Rp {format_rupiah(v)}",
+                        "tabungan_minimal": lambda v: f"Rp {format_rupiah(v)}",
+                        "skor": "{:.2f}",
+                    }),
+                    use_container_width=True, hide_index=True,
+                )
+
 # ===================== Halaman About Me =====================
 elif selected == "About Me":
     st.title("👤 About Me")
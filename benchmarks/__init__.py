@@ -0,0 +1 @@
+"""Benchmark offline untuk Finance Tracker (tanpa akses Gmail sungguhan)."""
@@ -0,0 +1,87 @@
+"""Ukur query store dengan jendela tanggal yang digeser, dengan dan tanpa DayCache.
+
+Jalankan: ``python -m benchmarks.bench_cache --per-day 40 --shifts 60``.
+Store SQLite sementara diisi transaksi sintetis dua pengirim selama setahun.
+Polanya meniru pemakaian UI: jendela 30 hari digeser sehari demi sehari,
+lalu pengirim kedua ditambahkan. Hasil kedua mode dicek sama.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, time as dtime, timedelta
+
+import pandas as pd
+
+from tracker.store import TransactionStore
+
+SENDERS = {
+    "noreply.livin@bankmandiri.co.id": "Livin' by Mandiri <noreply.livin@bankmandiri.co.id>",
+    "bca@bca.co.id": "BCA <bca@bca.co.id>",
+}
+
+
+def fill_store(store, end, days, per_day, seed=0):
+    rng = random.Random(seed)
+    ids, rows = [], []
+    for d in range(days):
+        day = end - timedelta(days=d)
+        for pengirim in SENDERS.values():
+            for i in range(per_day):
+                ids.append(f"{pengirim[:3]}-{day.isoformat()}-{i}")
+                rows.append({
+                    "tanggal": datetime.combine(day, dtime(rng.randrange(24), rng.randrange(60))),
+                    "tipe": rng.choice(["Pendapatan", "Pengeluaran"]),
+                    "amount": rng.randrange(10_000, 5_000_000, 1_000),
+                    "pengirim": pengirim,
+                    "kanal": rng.choice(["QRIS", "Transfer", "Virtual Account"]),
+                    "pihak": f"Toko {rng.randrange(500)}",
+                })
+    store.add(ids, pd.DataFrame(rows, index=ids))
+
+
+def workload(end, shifts):
+    mandiri, bca = list(SENDERS)
+    for s in range(shifts):
+        start = end - timedelta(days=30 + s)
+        yield [mandiri], start, start + timedelta(days=30)
+    for s in range(shifts):
+        start = end - timedelta(days=30 + s)
+        yield [mandiri, bca], start, start + timedelta(days=30)
+
+
+def run(store, end, shifts):
+    results = []
+    t0 = time.perf_counter()
+    for senders, start, stop in workload(end, shifts):
+        results.append(store.query(senders, start, stop))
+    return time.perf_counter() - t0, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-day", type=int, default=40)
+    parser.add_argument("--shifts", type=int, default=60)
+    args = parser.parse_args()
+    end = date(2024, 12, 31)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        fill_store(TransactionStore(path), end, 365, args.per_day)
+
+        uncached, expected = run(TransactionStore(path, cache_rows=0), end, args.shifts)
+        store = TransactionStore(path)
+        cached, results = run(store, end, args.shifts)
+
+    for want, got in zip(expected, results):
+        pd.testing.assert_frame_equal(want, got)
+    queries = len(results)
+    print(f"{queries} query, {args.per_day} transaksi/hari/pengirim, hasil sama")
+    print(f"  tanpa cache : {uncached / queries * 1000:7.2f} ms/query")
+    print(f"  DayCache    : {cached / queries * 1000:7.2f} ms/query ({uncached / cached:.1f}x)")
+    print(f"  {store.cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Ukur biaya render grafik: pyplot per rerun vs bytes gambar yang di-cache.
+
+Jalankan: ``python -m benchmarks.bench_charts --reruns 1000``. Setiap rerun
+menggambar tiga grafik Finance Tracker. Mode lama memakai ``plt.subplots``
+tanpa menutup figure bar (seperti ``clear_figure=False``); mode baru memakai
+``tracker.ui.chart_image``. Dicetak waktu per rerun, jumlah figure pyplot
+yang masih hidup, dan pertumbuhan memori (RSS) proses.
+"""
+import argparse
+import gc
+import logging
+import resource
+import time
+from datetime import date, timedelta
+from io import BytesIO
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from tracker import charts
+from tracker.ui import chart_image
+
+
+def sample_aggregates(days=30):
+    start = date(2024, 5, 1)
+    dates = tuple(start + timedelta(days=i) for i in range(days))
+    amounts = tuple(50_000 + 1_000 * i for i in range(days))
+    return (
+        (12_500_000, 8_250_000),
+        (("Pengeluaran", "Pendapatan"), (days, 4)),
+        (dates, amounts),
+    )
+
+
+def rss_mb():
+    # ru_maxrss dalam KB di Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def rerun_pyplot(bar, pie, daily):
+    fig, ax = plt.subplots(figsize=charts.FIGSIZE)
+    ax.bar(['Pendapatan', 'Pengeluaran'], list(bar))
+    fig.savefig(BytesIO(), format="png")  # bar: tidak pernah ditutup
+    for build in (lambda a: a.pie(pie[1], labels=pie[0]), lambda a: a.plot(*daily)):
+        fig, ax = plt.subplots(figsize=charts.FIGSIZE)
+        build(ax)
+        fig.savefig(BytesIO(), format="png")
+        plt.close(fig)  # clear_figure=True
+
+
+def rerun_cached(bar, pie, daily):
+    chart_image("income_expense_bar", *bar)
+    chart_image("tipe_pie", *pie)
+    chart_image("daily_expense_line", *daily)
+
+
+def measure(name, rerun, reruns, aggregates):
+    gc.collect()
+    rss_before = rss_mb()
+    t0 = time.perf_counter()
+    rerun(*aggregates)
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(reruns - 1):
+        rerun(*aggregates)
+    per_rerun = (time.perf_counter() - t0) / max(reruns - 1, 1)
+    gc.collect()
+    print(f"{name:<10} pertama {first * 1000:7.1f} ms | berikutnya {per_rerun * 1000:8.3f} ms/rerun"
+          f" | figure hidup {len(plt.get_fignums()):5d} | RSS +{rss_mb() - rss_before:6.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reruns", type=int, default=1000)
+    args = parser.parse_args()
+    # st.cache_data di luar `streamlit run` memberi peringatan "bare mode"
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    plt.rcParams["figure.max_open_warning"] = 0
+
+    aggregates = sample_aggregates()
+    # Mode baru dulu, supaya pertumbuhan RSS mode lama tidak menutupinya
+    measure("cached", rerun_cached, args.reruns, aggregates)
+    measure("pyplot", rerun_pyplot, args.reruns, aggregates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Bandingkan loop serial vs pengambilan paralel terhadap FakeGmailService.
+
+Jalankan: ``python -m benchmarks.bench_fetch --messages 200 --latency 0.05``
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.fake_gmail import WIB, FakeGmailService, make_message
+from tracker.fetch import get_transactions
+
+SENDERS = [
+    "Livin' by Mandiri <noreply.livin@bankmandiri.co.id>",
+    "BCA <bca@bca.co.id>",
+]
+
+
+def build_corpus(n, end_date, seed=0):
+    rng = random.Random(seed)
+    messages = []
+    for i in range(n):
+        date = datetime.combine(end_date, datetime.min.time(), WIB) - timedelta(minutes=rng.randint(0, 29 * 24 * 60))
+        amount = rng.randint(1, 5000) * 1000
+        if rng.random() < 0.3:
+            subject, body = "Transfer Masuk", f"Dana masuk sebesar Rp {amount:,}".replace(",", ".")
+        else:
+            subject, body = "Pembayaran Berhasil", f"Pembayaran QRIS sebesar Rp {amount:,}".replace(",", ".")
+        messages.append(make_message(f"m{i:06d}", rng.choice(SENDERS), date, subject, body))
+    return messages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    end_date = datetime.now(WIB).date()
+    start_date = end_date - timedelta(days=30)
+    service = FakeGmailService(build_corpus(args.messages, end_date), latency=args.latency)
+    senders = ["noreply.livin@bankmandiri.co.id", "bca@bca.co.id"]
+
+    timings = {}
+    frames = {}
+    for label, workers in (("serial", 1), ("paralel", args.workers)):
+        t0 = time.perf_counter()
+        frames[label] = get_transactions(service, senders, start_date, end_date,
+                                         max_workers=workers)
+        timings[label] = time.perf_counter() - t0
+        print(f"{label:>8}: {timings[label]:.2f} s ({len(frames[label])} transaksi)")
+
+    assert frames["serial"].equals(frames["paralel"]), "hasil paralel berbeda dari serial"
+    print(f" speedup: {timings['serial'] / timings['paralel']:.1f}x dengan {args.workers} worker")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Ukur biaya import per halaman dan pastikan modul berat tidak ikut dimuat.
+
+Jalankan: ``python -m benchmarks.bench_import --repeat 5``. Bagian pertama
+memakai ``python -X importtime`` di proses baru untuk setiap modul (angka
+kumulatif, median dari beberapa kali jalan). Bagian kedua me-render setiap
+halaman lewat ``streamlit.testing`` di proses baru lalu mencatat modul berat
+mana yang ada di ``sys.modules``.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "streamlit",
+    "streamlit_option_menu",
+    "afford",
+    "tracker.ui",
+    "pandas",
+    "tracker.store",
+    "tracker.fetch",
+    "tracker.gmail",
+    "tracker.charts",
+]
+HEAVY = ["pandas", "matplotlib", "googleapiclient", "google_auth_oauthlib", "google.auth"]
+PAGES = ["Home", "Can I Afford To Buy This?", "About Me", "Finance Tracker"]
+
+
+def import_time_us(module):
+    """Waktu import kumulatif (mikrodetik) sebuah modul di interpreter baru."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in reversed(proc.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    return 0
+
+
+def render_page(page):
+    """Dipanggil di proses anak: render satu halaman dan laporkan modul berat."""
+    import time
+
+    import streamlit_option_menu
+    streamlit_option_menu.option_menu = lambda *a, **k: page
+    from streamlit.testing.v1 import AppTest
+
+    before = set(sys.modules)
+    t0 = time.perf_counter()
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60).run()
+    elapsed = time.perf_counter() - t0
+    loaded = [m for m in HEAVY if m in sys.modules and m not in before]
+    print(json.dumps({"seconds": elapsed, "loaded": loaded, "errors": [e.message for e in at.exception]}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--page", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.page:
+        render_page(args.page)
+        return
+
+    print("import kumulatif (median, ms)")
+    for module in MODULES:
+        times = [import_time_us(module) for _ in range(args.repeat)]
+        print(f"  {module:<24} {statistics.median(times) / 1000:8.1f}")
+
+    print("\nrender pertama per halaman")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    for page in PAGES:
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_import", "--page", page],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        loaded = ", ".join(result["loaded"]) or "-"
+        print(f"  {page:<28} {result['seconds'] * 1000:8.1f} ms  modul berat: {loaded}")
+        if result["errors"]:
+            print(f"    error: {result['errors']}")
+
+
+if __name__ == "__main__":
+    main()
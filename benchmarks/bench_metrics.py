@@ -0,0 +1,66 @@
+"""Ukur overhead instrumentasi ``tracker.metrics`` untuk mode off, basic, dan detail.
+
+Jalankan: ``python -m benchmarks.bench_metrics --messages 2000``.
+Sinkronisasi penuh ke Gmail palsu tanpa latensi (agar overhead tidak
+tertutup waktu jaringan) dijalankan untuk setiap mode, lalu rincian per
+tahap dari mode detail dan contoh keluaran Prometheus dicetak.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.bench_fetch import build_corpus
+from benchmarks.fake_gmail import WIB, FakeGmailService
+from tracker.fetch import sync_transactions
+from tracker.metrics import METRICS, MODES
+from tracker.store import TransactionStore
+
+SENDERS = ["noreply.livin@bankmandiri.co.id", "bca@bca.co.id"]
+
+
+def sync_once(corpus, end, workers):
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TransactionStore(os.path.join(tmp, "tx.db"))
+        t0 = time.perf_counter()
+        sync_transactions(FakeGmailService(corpus), store, SENDERS, end - timedelta(days=30), end,
+                          max_workers=workers)
+        store.query(SENDERS, end - timedelta(days=30), end)
+        return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    end = datetime.now(WIB).date() - timedelta(days=1)
+    corpus = build_corpus(args.messages, end)
+    sync_once(corpus, end, args.workers)  # pemanasan import dan regex
+
+    timings = {}
+    # Bergantian per putaran agar gangguan mesin terbagi rata ke semua mode
+    for _ in range(args.repeat):
+        for mode in MODES:
+            METRICS.set_mode(mode)
+            METRICS.reset()
+            elapsed = sync_once(corpus, end, args.workers)
+            timings[mode] = min(timings.get(mode, elapsed), elapsed)
+
+    base = timings["off"]
+    print(f"sinkronisasi {args.messages} pesan (terbaik dari {args.repeat}):")
+    for mode in MODES:
+        print(f"  {mode:<6} {timings[mode] * 1000:8.1f} ms  overhead {timings[mode] / base - 1:+6.1%}")
+
+    print("\nrincian tahap (mode detail, putaran terakhir):")
+    for name, s in sorted(METRICS.snapshot()["stages"].items(), key=lambda item: -item[1]["seconds"]):
+        print(f"  {name:<14} {s['count']:6d}x {s['seconds'] * 1000:8.1f} ms")
+    print("\nPrometheus (potongan):")
+    print("\n".join(METRICS.to_prometheus().splitlines()[:8]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Bandingkan ``parse_message`` per pesan dengan ``parse_messages`` per batch.
+
+Jalankan: ``python -m benchmarks.bench_parse --messages 20000``
+Keduanya memakai parser yang sama dari ``tracker.parsers``; bedanya hanya
+jalur per pesan membuat dict per transaksi lalu DataFrame dari list dict,
+sedangkan batch membangun kolom-kolomnya langsung sekali per batch.
+"""
+import argparse
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from benchmarks.bench_fetch import build_corpus
+from benchmarks.check_extraction import sample_messages
+from benchmarks.fake_gmail import WIB
+from tracker.batch import parse_messages
+from tracker.frame import compact, to_local
+from tracker.parsing import parse_message
+
+
+def parse_each(messages):
+    rows, ids = [], []
+    for msg in messages:
+        trx = parse_message(msg)
+        if trx is not None:
+            rows.append(trx)
+            ids.append(msg["id"])
+    df = pd.DataFrame(rows)
+    df["tanggal"] = to_local(df["tanggal"])
+    return compact(df).set_axis(pd.Index(ids, name="id"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    samples = sample_messages()
+    messages = build_corpus(args.messages - len(samples), datetime.now(WIB).date()) + samples
+
+    timings = {}
+    for label, fn in (("per pesan", parse_each), ("batch", parse_messages)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            result = fn(messages)
+            best = min(best, time.perf_counter() - t0)
+        timings[label] = (best, result)
+
+    pd.testing.assert_frame_equal(timings["per pesan"][1], timings["batch"][1], check_categorical=False)
+    for label, (elapsed, result) in timings.items():
+        print(f"{label:>10}: {elapsed:.3f} s ({len(result)} transaksi)")
+    print(f"   speedup: {timings['per pesan'][0] / timings['batch'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
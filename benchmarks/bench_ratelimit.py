@@ -0,0 +1,83 @@
+"""Sinkronisasi terhadap Gmail palsu yang membatasi kuota, dengan dan tanpa QuotaScheduler.
+
+Jalankan: ``python -m benchmarks.bench_ratelimit --messages 600 --quota 250``.
+Tanpa scheduler, 429 pertama menghentikan sinkronisasi (potongan yang
+sudah selesai tetap tersimpan). Dengan scheduler, semua pesan harus masuk
+dan laju unit yang diterima server mendekati batas kuota. Kasus terakhir
+meniru kuota yang sebagian dipakai klien lain: server hanya menerima 60%
+dari batas yang diasumsikan scheduler, sehingga laju harus menyesuaikan.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from googleapiclient.errors import HttpError
+
+from benchmarks.bench_fetch import build_corpus
+from benchmarks.fake_gmail import WIB, FakeGmailService
+from tracker.fetch import sync_transactions
+from tracker.ratelimit import QuotaScheduler
+from tracker.store import TransactionStore
+
+SENDERS = ["noreply.livin@bankmandiri.co.id", "bca@bca.co.id"]
+
+
+def run(corpus, end, args, scheduler, server_quota):
+    service = FakeGmailService(corpus, latency=args.latency, quota_per_second=server_quota,
+                               error_rate=args.error_rate)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TransactionStore(os.path.join(tmp, "tx.db"))
+        t0 = time.perf_counter()
+        error = None
+        try:
+            sync_transactions(service, store, SENDERS, end - timedelta(days=30), end,
+                              max_workers=args.workers, scheduler=scheduler)
+        except HttpError as e:
+            error = e.resp.status
+        elapsed = time.perf_counter() - t0
+        saved = len(store.known_ids(m["id"] for m in corpus))
+
+    admitted = service.admitted
+    # Laju diukur setelah detik pertama, saat burst awal sudah habis
+    steady = [(t, u) for t, u in admitted if t >= admitted[0][0] + 1.0] if admitted else []
+    span = steady[-1][0] - steady[0][0] if len(steady) > 1 else 0
+    units_per_second = sum(u for _, u in steady) / span if span else 0.0
+    return {
+        "saved": saved,
+        "elapsed": elapsed,
+        "error": error,
+        "units_per_second": units_per_second,
+        "rejected": service.rejected,
+    }
+
+
+def report(name, result, total, quota):
+    status = f"berhenti karena HTTP {result['error']}" if result["error"] else "selesai"
+    print(f"{name:<16} {result['saved']:5d}/{total} pesan tersimpan, {status}, {result['elapsed']:6.1f} s")
+    print(f"{'':<16} {result['units_per_second']:6.1f} unit/s diterima ({result['units_per_second'] / quota:.0%} kuota),"
+          f" ditolak: {result['rejected']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=600)
+    parser.add_argument("--quota", type=int, default=250)
+    parser.add_argument("--latency", type=float, default=0.03)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    args = parser.parse_args()
+
+    end = datetime.now(WIB).date() - timedelta(days=1)
+    corpus = build_corpus(args.messages, end)
+
+    report("tanpa scheduler", run(corpus, end, args, None, args.quota), args.messages, args.quota)
+    for name, server_quota in (("QuotaScheduler", args.quota), ("kuota 60%", int(args.quota * 0.6))):
+        scheduler = QuotaScheduler(units_per_second=args.quota, base_delay=0.05)
+        report(name, run(corpus, end, args, scheduler, server_quota), args.messages, server_quota)
+        print(f"{'':<16} scheduler: {scheduler.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Ukur parse ulang dari arsip lokal dibanding mengunduh ulang dari Gmail.
+
+Jalankan: ``python -m benchmarks.bench_reparse --messages 5000 --latency 0.05``.
+Korpus sintetis disinkronkan sekali lewat Gmail palsu (dengan latensi per
+request) ke store + arsip, lalu arsip di-parse ulang dengan 1 proses dan
+dengan pool proses. Isi store setelah parse ulang dicek sama dengan hasil
+sinkronisasi awal.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from benchmarks.bench_fetch import build_corpus
+from benchmarks.fake_gmail import WIB, FakeGmailService
+from tracker.archive import MessageArchive
+from tracker.fetch import sync_transactions
+from tracker.reparse import reparse
+from tracker.store import TransactionStore
+
+SENDERS = ["noreply.livin@bankmandiri.co.id", "bca@bca.co.id"]
+
+
+def archive_bytes(root):
+    total = 0
+    for dirpath, _, filenames in os.walk(os.path.join(root, "objects")):
+        total += sum(os.path.getsize(os.path.join(dirpath, name)) for name in filenames)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    end = datetime.now(WIB).date() - timedelta(days=1)
+    corpus = build_corpus(args.messages, end)
+    raw_bytes = sum(len(json.dumps(m).encode()) for m in corpus)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TransactionStore(os.path.join(tmp, "tx.db"))
+        archive = MessageArchive(os.path.join(tmp, "archive"))
+        service = FakeGmailService(corpus, latency=args.latency)
+
+        t0 = time.perf_counter()
+        sync_transactions(service, store, SENDERS, end - timedelta(days=30), end, archive=archive)
+        download = time.perf_counter() - t0
+        expected = store.query(SENDERS, end - timedelta(days=30), end)
+
+        timings = {}
+        for workers in dict.fromkeys([1, args.workers]):
+            t0 = time.perf_counter()
+            reparse(archive, store, workers=workers)
+            timings[workers] = time.perf_counter() - t0
+            pd.testing.assert_frame_equal(store.query(SENDERS, end - timedelta(days=30), end), expected)
+        stored = archive_bytes(archive.root)
+
+    print(f"{args.messages} pesan, hasil parse ulang sama dengan sinkronisasi awal")
+    print(f"  arsip: {stored / 1e6:.1f} MB dari {raw_bytes / 1e6:.1f} MB JSON ({raw_bytes / stored:.1f}x lebih kecil)")
+    print(f"  unduh + parse (latensi {args.latency * 1000:.0f} ms): {download:7.2f} s")
+    for workers, elapsed in timings.items():
+        print(f"  parse ulang, {workers} proses: {elapsed:7.2f} s ({args.messages / elapsed:.0f} pesan/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Bandingkan biaya ringkasan + data grafik: dari semua transaksi vs dari rollup.
+
+Jalankan: ``python -m benchmarks.bench_rollup --per-day 20 --years 3``.
+Cara lama: ``store.query`` seluruh rentang lalu mask boolean dan groupby
+per hari. Cara baru: ``store.rollup`` (harian untuk rentang pendek,
+bulanan untuk rentang panjang). Total kedua cara dicek sama.
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+from benchmarks.bench_cache import SENDERS, fill_store
+from tracker.store import TransactionStore
+
+RANGES = [30, 365, 3 * 365]
+DAILY_CHART_MAX_DAYS = 92
+
+
+def from_transactions(store, senders, start, end):
+    df = store.query(senders, start, end)
+    pendapatan = df[df['tipe'] == "Pendapatan"]['amount'].sum()
+    pengeluaran = df[df['tipe'] == "Pengeluaran"]['amount'].sum()
+    df['tipe'].value_counts()
+    keluar = df.loc[df['tipe'] == "Pengeluaran", ['tanggal', 'amount']]
+    keluar.groupby(keluar['tanggal'].dt.normalize())['amount'].sum()
+    return int(pendapatan), int(pengeluaran)
+
+
+def from_rollup(store, senders, start, end):
+    period = "day" if (end - start).days < DAILY_CHART_MAX_DAYS else "month"
+    per_tipe = store.rollup(senders, start, end, period).groupby('tipe')['total'].sum()
+    return int(per_tipe.get("Pendapatan", 0)), int(per_tipe.get("Pengeluaran", 0))
+
+
+def timed(fn, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-day", type=int, default=20)
+    parser.add_argument("--years", type=int, default=3)
+    args = parser.parse_args()
+    end = date(2024, 12, 31)
+    senders = list(SENDERS)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        t0 = time.perf_counter()
+        fill_store(TransactionStore(path), end, args.years * 365, args.per_day)
+        print(f"isi store + rollup: {time.perf_counter() - t0:.1f} s")
+        # Tanpa DayCache agar cara lama tidak diuntungkan oleh cache baris
+        store = TransactionStore(path, cache_rows=0)
+        for days in RANGES:
+            start = end - timedelta(days=days - 1)
+            old, expected = timed(from_transactions, store, senders, start, end)
+            new, result = timed(from_rollup, store, senders, start, end)
+            assert result == expected, (days, result, expected)
+            rows = days * len(senders) * args.per_day
+            print(f"{days:5d} hari ({rows:7d} transaksi): transaksi {old * 1000:8.1f} ms | rollup {new * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Ukur simulasi tabungan untuk berbagai lama menabung.
+
+Jalankan: ``python -m benchmarks.bench_savings``. Dulu setiap bulan menjadi
+satu ``st.progress``; sekarang jumlah titik grafik dan waktu hitung harus
+tetap kecil meski targetnya butuh ratusan ribu bulan.
+"""
+import time
+
+from afford import simulasi_tabungan
+
+KASUS = [
+    # (saldo awal, setoran/bulan, target, bunga %/th, inflasi %/th)
+    (1_000_000, 500_000, 5_000_000, 0, 0),
+    (0, 100_000, 500_000_000, 0, 0),
+    (0, 1_000, 500_000_000, 0, 0),
+    (0, 100_000, 500_000_000, 6, 0),
+    (0, 100_000, 500_000_000, 6, 3),
+    (0, 100_000, 500_000_000, 3, 6),
+]
+
+
+def main():
+    for kasus in KASUS:
+        t0 = time.perf_counter()
+        hasil = simulasi_tabungan(*kasus)
+        elapsed = time.perf_counter() - t0
+        bulan = hasil["bulan"] if hasil["bulan"] is not None else "tidak tercapai"
+        print(f"{str(kasus):<45} bulan={bulan!s:<15} titik={len(hasil['titik']):4d}"
+              f"  widget lama={hasil['bulan'] or 0:>10}  {elapsed * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
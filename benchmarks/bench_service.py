@@ -0,0 +1,65 @@
+"""Ukur biaya cold start klien Gmail: build per sesi vs klien bersama yang di-cache.
+
+Jalankan: ``python -m benchmarks.bench_service --sessions 20``. Memakai token
+palsu yang belum kedaluwarsa, jadi waktu refresh token (round trip ke
+Google) tidak ikut terukur; di produksi selisihnya lebih besar lagi.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+
+from tracker.gmail import SCOPES, GmailClient
+
+
+def write_token(path):
+    expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+    with open(path, "w") as token:
+        json.dump({
+            "token": "fake-access-token",
+            "refresh_token": "fake-refresh-token",
+            "client_id": "fake-client-id",
+            "client_secret": "fake-client-secret",
+            "scopes": SCOPES,
+            "expiry": expiry.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }, token)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        token_path = os.path.join(tmp, "token.json")
+        write_token(token_path)
+
+        # Sebelum: setiap sesi membaca token dan membangun service sendiri
+        t0 = time.perf_counter()
+        for _ in range(args.sessions):
+            creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+            build('gmail', 'v1', credentials=creds)
+        before = (time.perf_counter() - t0) / args.sessions
+
+        # Sesudah: satu klien dibuat sekali, sesi berikutnya hanya memakai ulang
+        t0 = time.perf_counter()
+        client = GmailClient(Credentials.from_authorized_user_file(token_path, SCOPES), token_path)
+        first = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for _ in range(args.sessions):
+            client.service, client.http()
+        after = (time.perf_counter() - t0) / args.sessions
+        client.close()
+
+    print(f"   build per sesi: {before * 1000:.1f} ms")
+    print(f"klien bersama (1x): {first * 1000:.1f} ms")
+    print(f" klien bersama/sesi: {after * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
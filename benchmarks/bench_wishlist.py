@@ -0,0 +1,66 @@
+"""Bandingkan penilaian wishlist per barang (saw_rekomendasi) vs vectorized.
+
+Jalankan: ``python -m benchmarks.bench_wishlist --items 100000``. Hasil
+kedua cara dicek sama (skor, tabungan aman, peringatan) sebelum waktunya
+dicetak.
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from afford import peringatan, saw_rekomendasi
+from wishlist import nilai_wishlist, pesan_peringatan
+
+
+def build_wishlist(n, seed=0):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        "nama": [f"barang-{i}" for i in range(n)],
+        "harga": [rng.randrange(10_000, 50_000_000, 1_000) for _ in range(n)],
+        "bahagia": [rng.randint(0, 100) for _ in range(n)],
+        "penting": [rng.randint(0, 100) for _ in range(n)],
+    })
+
+
+def per_item(wishlist, uang_sekarang):
+    rows = []
+    for nama, harga, bahagia, penting in wishlist[["nama", "harga", "bahagia", "penting"]].itertuples(index=False):
+        skor, n_afford, n_bahagia, n_penting, tabungan_minimal = saw_rekomendasi(uang_sekarang, harga, bahagia, penting)
+        rows.append((nama, skor, tabungan_minimal, peringatan(n_afford, n_bahagia, n_penting)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--uang", type=int, default=25_000_000)
+    args = parser.parse_args()
+
+    wishlist = build_wishlist(args.items)
+
+    t0 = time.perf_counter()
+    expected = per_item(wishlist, args.uang)
+    loop = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    hasil = nilai_wishlist(wishlist, args.uang)
+    vectorized = time.perf_counter() - t0
+
+    by_name = hasil.set_index("nama")
+    for nama, skor, tabungan_minimal, warnings in expected:
+        baris = by_name.loc[nama]
+        assert np.isclose(baris["skor"], skor), nama
+        assert baris["tabungan_minimal"] == tabungan_minimal, nama
+        assert pesan_peringatan(baris) == warnings, nama
+    assert hasil["skor"].is_monotonic_decreasing
+
+    print(f"{args.items} barang, hasil sama")
+    print(f"  per barang : {loop * 1000:8.1f} ms")
+    print(f"  vectorized : {vectorized * 1000:8.1f} ms ({loop / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
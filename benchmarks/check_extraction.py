@@ -0,0 +1,86 @@
+"""Bandingkan ekstraksi "fast" dengan jalur BeautifulSoup lama pada contoh email Mandiri/BCA.
+
+Jalankan: ``python -m benchmarks.check_extraction``. Keluar dengan status 1
+jika jumlah atau tipe transaksi berbeda antara kedua mode. Hasil yang benar
+untuk setiap contoh dicek otomatis di ``tests/test_extraction.py``.
+"""
+import sys
+import time
+from datetime import datetime
+
+from benchmarks.fake_gmail import WIB, make_message, multipart, text_part
+from tracker.parsing import parse_message
+
+MANDIRI = "Livin' by Mandiri <noreply.livin@bankmandiri.co.id>"
+BCA = "BCA <bca@bca.co.id>"
+
+MANDIRI_HTML = """<html><head><style>td {{ font-family: Arial; }}</style></head>
+<body><table>
+<tr><td>Penerima</td><td>{merchant}</td></tr>
+<tr><td>Tanggal</td><td>17 Okt 2026</td></tr>
+<tr><td>Nominal Transaksi</td><td>Rp&nbsp;{amount}</td></tr>
+</table><!-- footer --><p>Pembayaran QRIS berhasil.</p></body></html>"""
+
+BCA_PLAIN = """Yth. Nasabah BCA,
+Transfer masuk ke rekening Anda:
+Nominal : IDR {amount}
+Dari    : {merchant}
+"""
+
+
+def sample_messages():
+    date = datetime(2026, 10, 17, 9, 30, tzinfo=WIB)
+    return [
+        make_message("html", MANDIRI, date, "Pembayaran Berhasil",
+                     MANDIRI_HTML.format(merchant="KOPI KENANGAN", amount="45.000"), "text/html"),
+        make_message("plain", BCA, date, "Transfer Masuk",
+                     BCA_PLAIN.format(merchant="BUDI SANTOSO", amount="1,250,000.00")),
+        make_message("alternative", MANDIRI, date, "Transfer Keluar", multipart(
+            "multipart/alternative",
+            text_part("text/plain", "Transfer keluar sebesar Rp 2.500.000,00 ke ANI"),
+            text_part("text/html", MANDIRI_HTML.format(merchant="ANI", amount="2.500.000,00")),
+        )),
+        make_message("html-only", MANDIRI, date, "Top-up Berhasil", multipart(
+            "multipart/alternative",
+            text_part("text/html", MANDIRI_HTML.format(merchant="GOPAY", amount="100.000")),
+        )),
+        make_message("nested", BCA, date, "Transfer Masuk", multipart(
+            "multipart/mixed",
+            multipart(
+                "multipart/alternative",
+                text_part("text/plain", BCA_PLAIN.format(merchant="PT MAJU", amount="7,500,000.00")),
+                text_part("text/html", "<p>Transfer masuk IDR 7,500,000.00</p>"),
+            ),
+            {"mimeType": "application/pdf", "filename": "bukti.pdf", "body": {"attachmentId": "a1", "size": 1024}},
+        )),
+    ]
+
+
+def summarize(trx):
+    return None if trx is None else (trx["amount"], trx["tipe"])
+
+
+def main():
+    messages = sample_messages()
+    ok = True
+    for msg in messages:
+        soup = summarize(parse_message(msg, extract_mode="soup"))
+        fast = summarize(parse_message(msg, extract_mode="fast"))
+        status = "OK" if soup == fast or soup is None else "BEDA"
+        ok &= status == "OK"
+        print(f"{msg['id']:>12}: soup={soup} fast={fast} {status}")
+
+    rounds = 2000
+    for mode in ("soup", "fast"):
+        t0 = time.perf_counter()
+        for _ in range(rounds):
+            for msg in messages:
+                parse_message(msg, extract_mode=mode)
+        elapsed = time.perf_counter() - t0
+        print(f"{mode:>12}: {rounds * len(messages) / elapsed:,.0f} email/detik")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
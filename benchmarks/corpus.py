@@ -0,0 +1,183 @@
+"""Generator korpus email notifikasi Mandiri/BCA sintetis yang realistis.
+
+Setiap pesan dibuat dari template yang meniru notifikasi asli: text/plain,
+text/html, multipart/alternative, dan multipart/mixed berlampiran PDF;
+nominal format Indonesia (``1.250.000,00``) maupun Inggris
+(``1,250,000.00``); transaksi masuk dan keluar; ditambah sebagian kecil
+email promo tanpa nominal. ``generate_corpus`` juga mengembalikan jawaban
+yang benar per pesan sehingga hasil parsing bisa dicek.
+"""
+import random
+from datetime import datetime, time, timedelta
+
+from benchmarks.fake_gmail import WIB, make_message, multipart, text_part
+
+MANDIRI = "Livin' by Mandiri <noreply.livin@bankmandiri.co.id>"
+BCA = "BCA <bca@bca.co.id>"
+SENDER_ADDRESSES = ["noreply.livin@bankmandiri.co.id", "bca@bca.co.id"]
+
+# Porsi email promo (tanpa nominal, bukan transaksi)
+PROMO_RATE = 0.05
+
+MERCHANTS = ["KOPI KENANGAN", "INDOMARET", "ALFAMART", "GRAB", "TOKOPEDIA", "SHOPEE", "PLN PASCABAYAR",
+             "MCDONALDS", "SATE KHAS SENAYAN", "APOTEK K-24", "PERTAMINA", "GOPAY", "OVO"]
+PEOPLE = ["BUDI SANTOSO", "SITI RAHAYU", "ANDI WIJAYA", "DEWI LESTARI", "PT MAJU JAYA", "RINA KUSUMA"]
+
+_HTML_HEAD = "<html><head><style>td {{ font-family: Arial; padding: 4px; }}</style></head><body>"
+_HTML_FOOT = ("<!-- footer --><p style=\"color:#888\">Email ini dibuat otomatis, mohon tidak dibalas.</p>"
+              "<script>track('{msg_id}');</script></body></html>")
+
+MANDIRI_QRIS_HTML = _HTML_HEAD + """<table>
+<tr><td>Penerima</td><td>{party}</td></tr>
+<tr><td>Tanggal</td><td>{tanggal}</td></tr>
+<tr><td>Nominal Transaksi</td><td>Rp&nbsp;{amount}</td></tr>
+<tr><td>Metode</td><td>QRIS</td></tr>
+</table><p>Pembayaran QRIS berhasil &amp; tercatat.</p>""" + _HTML_FOOT
+
+MANDIRI_TRANSFER_PLAIN = """Transfer keluar berhasil.
+Nama Penerima : {party}
+Tanggal : {tanggal}
+Nominal : Rp {amount}
+Terima kasih telah menggunakan Livin' by Mandiri.
+"""
+
+MANDIRI_INCOMING_PLAIN = """Dana masuk ke rekening Anda.
+Nama Pengirim : {party}
+Tanggal : {tanggal}
+Jumlah : Rp {amount}
+"""
+
+MANDIRI_TOPUP_HTML = _HTML_HEAD + """<table>
+<tr><td>Merchant</td><td>{party}</td></tr>
+<tr><td>Total Transaksi</td><td>Rp {amount}</td></tr>
+</table><p>Top-up e-wallet berhasil.</p>""" + _HTML_FOOT
+
+BCA_INCOMING_PLAIN = """Yth. Nasabah BCA,
+Transfer masuk ke rekening Anda:
+Nominal : IDR {amount}
+Dari    : {party}
+Tanggal : {tanggal}
+"""
+
+BCA_PAYMENT_PLAIN = """Yth. Nasabah BCA,
+Pembayaran melalui BCA mobile berhasil.
+Total Bayar : IDR {amount}
+Merchant : {party}
+"""
+
+BCA_PAYMENT_HTML = _HTML_HEAD + """<p>Yth. Nasabah BCA,</p>
+<p>Pembayaran melalui <b>BCA mobile</b> berhasil.</p>
+<table><tr><td>Total Bayar</td><td>: IDR {amount}</td></tr>
+<tr><td>Merchant</td><td>: {party}</td></tr></table>""" + _HTML_FOOT
+
+PROMO_HTML = _HTML_HEAD + """<h1>Promo Spesial Akhir Pekan</h1>
+<p>Nikmati cashback hingga 50% di merchant pilihan. Syarat &amp; ketentuan berlaku.</p>""" + _HTML_FOOT
+
+
+def format_amount(amount, style):
+    """``indonesia``: 1.250.000 atau 1.250.000,00; ``english``: 1,250,000.00."""
+    if style == "english":
+        return f"{amount:,.2f}"
+    text = f"{amount:,}".replace(",", ".")
+    return text + ",00" if amount % 3 else text
+
+
+def _random_amount(rng, incoming):
+    # Pemasukan jarang tetapi besar, pengeluaran sering tetapi kecil
+    if incoming:
+        return rng.randint(50, 20000) * 1000
+    return rng.choice([rng.randint(5, 200) * 500, rng.randint(1, 2000) * 1000])
+
+
+def _mandiri(rng, msg_id, date, tanggal):
+    kind = rng.choices(["qris", "transfer", "incoming", "topup"], weights=[45, 20, 20, 15])[0]
+    incoming = kind == "incoming"
+    amount = _random_amount(rng, incoming)
+    fields = {"amount": format_amount(amount, "indonesia"), "tanggal": tanggal, "msg_id": msg_id}
+    if kind == "qris":
+        fields["party"] = rng.choice(MERCHANTS)
+        subject, body = "Pembayaran Berhasil", (text_part("text/html", MANDIRI_QRIS_HTML.format(**fields)))
+    elif kind == "transfer":
+        fields["party"] = rng.choice(PEOPLE)
+        # multipart/alternative: plain diutamakan, HTML diabaikan
+        subject, body = "Transfer Keluar", multipart(
+            "multipart/alternative",
+            text_part("text/plain", MANDIRI_TRANSFER_PLAIN.format(**fields)),
+            text_part("text/html", f"<p>Transfer keluar Rp {fields['amount']} ke {fields['party']}</p>"),
+        )
+    elif kind == "incoming":
+        fields["party"] = rng.choice(PEOPLE)
+        subject, body = "Transfer Masuk", MANDIRI_INCOMING_PLAIN.format(**fields)
+    else:
+        fields["party"] = rng.choice(["GOPAY", "OVO", "DANA", "SHOPEEPAY"])
+        subject, body = "Top-up Berhasil", multipart(
+            "multipart/alternative", text_part("text/html", MANDIRI_TOPUP_HTML.format(**fields)))
+    message = make_message(msg_id, MANDIRI, date, subject, body)
+    return message, (amount, "Pendapatan" if incoming else "Pengeluaran")
+
+
+def _bca(rng, msg_id, date, tanggal):
+    kind = rng.choices(["incoming", "payment", "payment_pdf"], weights=[30, 50, 20])[0]
+    incoming = kind == "incoming"
+    amount = _random_amount(rng, incoming)
+    fields = {"amount": format_amount(amount, "english"), "tanggal": tanggal, "msg_id": msg_id}
+    if incoming:
+        fields["party"] = rng.choice(PEOPLE)
+        subject, body = "Transfer Masuk", BCA_INCOMING_PLAIN.format(**fields)
+    elif kind == "payment":
+        fields["party"] = rng.choice(MERCHANTS)
+        subject, body = "Pembayaran Berhasil", text_part("text/html", BCA_PAYMENT_HTML.format(**fields))
+    else:
+        fields["party"] = rng.choice(MERCHANTS)
+        # multipart/mixed berisi alternative bersarang dan lampiran bukti transaksi
+        subject, body = "Pembayaran Berhasil", multipart(
+            "multipart/mixed",
+            multipart(
+                "multipart/alternative",
+                text_part("text/plain", BCA_PAYMENT_PLAIN.format(**fields)),
+                text_part("text/html", BCA_PAYMENT_HTML.format(**fields)),
+            ),
+            {"mimeType": "application/pdf", "filename": "bukti.pdf",
+             "body": {"attachmentId": f"a-{msg_id}", "size": 24576}},
+        )
+    message = make_message(msg_id, BCA, date, subject, body)
+    return message, (amount, "Pendapatan" if incoming else "Pengeluaran")
+
+
+def _promo(rng, msg_id, date):
+    sender = rng.choice([MANDIRI, BCA])
+    body = PROMO_HTML.format(msg_id=msg_id)
+    return make_message(msg_id, sender, date, "Promo Spesial Akhir Pekan", body, "text/html"), None
+
+
+def generate_corpus(n, end_date, days=30, seed=0, promo_rate=PROMO_RATE):
+    """``n`` pesan tersebar acak selama ``days`` hari yang berakhir di ``end_date`` (WIB).
+
+    Mengembalikan ``(messages, expected)``; ``expected`` memetakan id pesan ke
+    ``(nominal, tipe)`` yang benar, atau None untuk email yang bukan transaksi.
+    """
+    rng = random.Random(seed)
+    first = datetime.combine(end_date - timedelta(days=days - 1), time.min, WIB)
+    messages, expected = [], {}
+    for i in range(n):
+        msg_id = f"{i:08x}"
+        date = first + timedelta(seconds=rng.randrange(days * 24 * 3600))
+        tanggal = date.strftime("%d/%m/%Y %H:%M WIB")
+        if rng.random() < promo_rate:
+            message, truth = _promo(rng, msg_id, date)
+        elif rng.random() < 0.55:
+            message, truth = _mandiri(rng, msg_id, date, tanggal)
+        else:
+            message, truth = _bca(rng, msg_id, date, tanggal)
+        messages.append(message)
+        expected[msg_id] = truth
+    return messages, expected
+
+
+def expected_totals(expected):
+    """Total nominal per tipe dari jawaban ``generate_corpus``."""
+    totals = {"Pendapatan": 0, "Pengeluaran": 0}
+    for truth in expected.values():
+        if truth is not None:
+            totals[truth[1]] += truth[0]
+    return totals
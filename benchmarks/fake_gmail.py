@@ -0,0 +1,208 @@
+"""Tiruan ``service`` Gmail in-process dengan latensi buatan.
+
+Meniru rantai ``service.users().messages().list(...).execute()`` dan
+``...get(...).execute()`` secukupnya agar mesin tracker bisa dijalankan
+tanpa jaringan. Bisa juga meniru batas kuota per detik (429
+``rateLimitExceeded``) dan error 5xx acak.
+"""
+import base64
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parseaddr
+
+import httplib2
+import pandas as pd
+from googleapiclient.errors import HttpError
+
+WIB = timezone(timedelta(hours=7))
+GMAIL_QUERY_TZ = "America/Los_Angeles"
+
+
+def _b64(text):
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii")
+
+
+def text_part(mime_type, text):
+    return {"mimeType": mime_type, "body": {"data": _b64(text), "size": len(text)}}
+
+
+def multipart(mime_type, *parts):
+    return {"mimeType": mime_type, "body": {"size": 0}, "parts": list(parts)}
+
+
+def make_message(msg_id, sender, date, subject, body, mime_type="text/plain"):
+    """Bangun pesan Gmail (format full).
+
+    ``body`` berupa teks untuk pesan satu bagian, atau payload dari
+    ``text_part``/``multipart`` untuk pesan multipart.
+    """
+    payload = text_part(mime_type, body) if isinstance(body, str) else dict(body)
+    payload["headers"] = [
+        {"name": "From", "value": sender},
+        {"name": "Date", "value": format_datetime(date)},
+        {"name": "Subject", "value": subject},
+    ]
+    return {
+        "id": msg_id,
+        "threadId": msg_id,
+        "internalDate": str(int(date.timestamp() * 1000)),
+        # Perkiraan ukuran seperti field sizeEstimate Gmail, dipakai counter byte di tracker.metrics
+        "sizeEstimate": len(json.dumps(payload)),
+        "payload": payload,
+    }
+
+
+def _query_time(value):
+    # Detik epoch apa adanya; tanggal dibaca Gmail sebagai tengah malam waktu Pasifik
+    if value.isdigit():
+        return int(value)
+    return pd.Timestamp(datetime.strptime(value, "%Y/%m/%d")).tz_localize(GMAIL_QUERY_TZ).timestamp()
+
+
+def http_error(status, reason):
+    resp = httplib2.Response({"status": status})
+    content = json.dumps({"error": {"code": status, "message": reason, "errors": [{"reason": reason}]}})
+    return HttpError(resp, content.encode("utf-8"))
+
+
+class _Request:
+    def __init__(self, service, kind, fn):
+        self._service = service
+        self._kind = kind
+        self._fn = fn
+
+    def execute(self, http=None, num_retries=0):
+        self._service._admit(self._kind)
+        delay = self._service._delay(self._kind)
+        if delay:
+            time.sleep(delay)
+        return self._fn()
+
+
+class _Messages:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, userId="me", q="", maxResults=100, pageToken=None, **kwargs):
+        return _Request(self._service, "list", lambda: self._service._list(q, maxResults, pageToken))
+
+    def get(self, userId="me", id=None, **kwargs):
+        return _Request(self._service, "get", lambda: self._service._get(id))
+
+
+class _Users:
+    def __init__(self, service):
+        self._service = service
+
+    def messages(self):
+        return _Messages(self._service)
+
+
+class FakeGmailService:
+    """Service Gmail palsu berisi ``messages`` (list dict format full).
+
+    ``latency`` adalah jeda (detik) untuk setiap ``execute``, meniru round trip
+    ke server; bisa berupa angka atau dict per method (``{"list": .., "get": ..}``).
+    ``jitter`` menambah jeda acak eksponensial dengan rata-rata sebesar itu,
+    sehingga ada ekor latensi seperti jaringan sungguhan. Query hanya memahami
+    ``from:``, ``after:`` dan ``before:``; seperti Gmail, nilainya detik epoch
+    atau tanggal ``YYYY/MM/DD`` yang dibaca sebagai tengah malam waktu Pasifik.
+
+    Jika ``quota_per_second`` diisi, request yang membuat total unit dalam satu
+    detik terakhir melebihi batas ditolak dengan 429 ``rateLimitExceeded``
+    (biaya per method dari ``costs``). ``error_rate`` adalah peluang sebuah
+    request gagal dengan 503.
+    """
+
+    def __init__(self, messages, latency=0.0, quota_per_second=None, costs=None, error_rate=0.0, seed=0,
+                 jitter=0.0):
+        # Gmail mengembalikan pesan terbaru lebih dulu
+        self._messages = sorted(messages, key=lambda m: int(m["internalDate"]), reverse=True)
+        self._by_id = {m["id"]: m for m in self._messages}
+        self._matched = {}  # query -> pesan yang cocok, agar paginasi korpus besar tidak memindai ulang
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = {"list": 0, "get": 0}
+        self.quota_per_second = quota_per_second
+        self.costs = costs or {"list": 5, "get": 5}
+        self.error_rate = error_rate
+        self.rejected = {"throttled": 0, "errors": 0}
+        self.admitted = []  # (waktu, unit) setiap request yang diterima
+        self._window = deque()
+        self._window_units = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def users(self):
+        return _Users(self)
+
+    def _admit(self, kind):
+        cost = self.costs[kind]
+        with self._lock:
+            now = time.monotonic()
+            while self._window and self._window[0][0] <= now - 1.0:
+                self._window_units -= self._window.popleft()[1]
+            if self.quota_per_second is not None and self._window_units + cost > self.quota_per_second:
+                self.rejected["throttled"] += 1
+                raise http_error(429, "rateLimitExceeded")
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.rejected["errors"] += 1
+                raise http_error(503, "backendError")
+            self._window.append((now, cost))
+            self._window_units += cost
+            self.admitted.append((now, cost))
+
+    def _delay(self, kind):
+        base = self.latency.get(kind, 0.0) if isinstance(self.latency, dict) else self.latency
+        if self.jitter:
+            with self._lock:
+                base += self._rng.expovariate(1 / self.jitter)
+        return base
+
+    def _count(self, name):
+        with self._lock:
+            self.calls[name] += 1
+
+    def _matches(self, msg, senders, after, before):
+        ts = int(msg["internalDate"]) / 1000
+        if after is not None and ts < after:
+            return False
+        if before is not None and ts >= before:
+            return False
+        if senders:
+            headers = msg["payload"]["headers"]
+            sender = next((h["value"] for h in headers if h["name"].lower() == "from"), "")
+            return parseaddr(sender)[1].lower() in senders
+        return True
+
+    def _list(self, q, max_results, page_token):
+        self._count("list")
+        matched = self._matched.get(q)
+        if matched is None:
+            matched = self._matched[q] = self._search(q)
+        start = int(page_token or 0)
+        page = matched[start:start + max_results]
+        result = {"resultSizeEstimate": len(matched)}
+        if page:
+            result["messages"] = [{"id": m["id"], "threadId": m["threadId"]} for m in page]
+        if start + max_results < len(matched):
+            result["nextPageToken"] = str(start + max_results)
+        return result
+
+    def _search(self, q):
+        senders = {s.lower() for s in re.findall(r"from:(\S+?)\)?(?=\s|$)", q)}
+        m = re.search(r"after:(\S+)", q)
+        after = _query_time(m.group(1)) if m else None
+        m = re.search(r"before:(\S+)", q)
+        before = _query_time(m.group(1)) if m else None
+
+        return [m for m in self._messages if self._matches(m, senders, after, before)]
+
+    def _get(self, msg_id):
+        self._count("get")
+        return self._by_id[msg_id]
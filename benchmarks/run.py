@@ -0,0 +1,173 @@
+"""Benchmark end-to-end Finance Tracker terhadap korpus sintetis dan Gmail palsu.
+
+Jalankan: ``python -m benchmarks.run --sizes 100 1000 10000 100000 --latency 0.005``.
+Korpus dari ``benchmarks.corpus`` (Mandiri/BCA, plain/HTML/multipart, dua
+format nominal, masuk dan keluar) disinkronkan lewat ``iter_sync`` ke store
+baru. Setiap ukuran dijalankan di proses anak sendiri agar puncak memori
+tidak saling memengaruhi. Dilaporkan per ukuran:
+
+- pesan/detik untuk sinkronisasi penuh (list, get, parse, simpan)
+- p50/p95 latensi per halaman yang dikirim ke UI (``--chunk-size`` pesan,
+  sama dengan satu pembaruan progres di aplikasi)
+- puncak memori proses dan kenaikannya selama sinkronisasi
+
+Total hasil parsing dicek sama dengan jawaban korpus. Terakhir dijalankan
+micro-benchmark ``extract_email_text``, ``normalize_amount`` dan
+``saw_rekomendasi``.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from benchmarks.corpus import SENDER_ADDRESSES, expected_totals, generate_corpus
+from benchmarks.fake_gmail import FakeGmailService
+
+END_DATE = date(2024, 12, 31)
+# Kepadatan email per hari; korpus besar mencakup rentang bertahun-tahun
+MESSAGES_PER_DAY = 20
+
+
+def percentile(values, p):
+    """Persentil nearest-rank; cukup untuk ringkasan latensi."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class PeakMemory:
+    """Puncak memori dalam byte: RSS proses jika ada modul ``resource``, jika tidak tracemalloc."""
+
+    def __init__(self):
+        try:
+            import resource
+        except ImportError:  # Windows
+            import tracemalloc
+
+            tracemalloc.start()
+            self.kind = "tracemalloc"
+            self._read = lambda: tracemalloc.get_traced_memory()[1]
+        else:
+            # ru_maxrss dalam KB di Linux, byte di macOS
+            scale = 1 if sys.platform == "darwin" else 1024
+            self.kind = "rss"
+            self._read = lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+    def peak(self):
+        return self._read()
+
+
+def run_size(n, latency, jitter, workers, chunk_size, seed=0):
+    """Sinkronkan korpus ``n`` pesan; dipanggil di proses anak."""
+    from tracker.fetch import iter_sync
+    from tracker.store import TransactionStore
+
+    memory = PeakMemory()
+    days = max(30, n // MESSAGES_PER_DAY)
+    start = END_DATE - timedelta(days=days - 1)
+    messages, expected = generate_corpus(n, END_DATE, days=days, seed=seed)
+    service = FakeGmailService(messages, latency=latency, jitter=jitter, seed=seed)
+    del messages
+    baseline = memory.peak()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TransactionStore(os.path.join(tmp, "tx.db"))
+        pages = []
+        t0 = last = time.perf_counter()
+        for _ in iter_sync(service, store, SENDER_ADDRESSES, start, END_DATE, chunk_size=chunk_size,
+                           max_workers=workers, today=END_DATE + timedelta(days=1)):
+            now = time.perf_counter()
+            pages.append(now - last)
+            last = now
+        elapsed = time.perf_counter() - t0
+        per_tipe = store.rollup(SENDER_ADDRESSES, start, END_DATE, "month").groupby("tipe")["total"].sum()
+    peak = memory.peak()
+
+    totals = {tipe: int(per_tipe.get(tipe, 0)) for tipe in ("Pendapatan", "Pengeluaran")}
+    if totals != expected_totals(expected):
+        raise AssertionError(f"total hasil parsing {totals} berbeda dari korpus {expected_totals(expected)}")
+    return {
+        "messages": n,
+        "seconds": elapsed,
+        "messages_per_second": n / elapsed,
+        "page_p50": percentile(pages, 50),
+        "page_p95": percentile(pages, 95),
+        "pages": len(pages),
+        "peak_bytes": peak,
+        "sync_bytes": peak - baseline,
+        "memory": memory.kind,
+    }
+
+
+def run_child(n, args):
+    cmd = [sys.executable, "-m", "benchmarks.run", "--child", str(n), "--latency", str(args.latency),
+           "--jitter", str(args.jitter), "--workers", str(args.workers), "--chunk-size", str(args.chunk_size)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def micro(n=5000, repeat=3):
+    """Throughput fungsi-fungsi inti pada korpus yang sama, terbaik dari ``repeat``."""
+    from afford import saw_rekomendasi
+    from tracker.parsers import AMOUNT_RE, normalize_amount
+    from tracker.parsing import extract_email_text
+
+    messages, _ = generate_corpus(n, END_DATE, days=30)
+    texts = [extract_email_text(m) for m in messages]
+    amounts = [m.group(1) for m in map(AMOUNT_RE.search, texts) if m]
+
+    cases = {
+        "extract_email_text": (len(messages), lambda: [extract_email_text(m) for m in messages]),
+        "normalize_amount": (len(amounts), lambda: [normalize_amount(a) for a in amounts]),
+        "saw_rekomendasi": (n, lambda: [saw_rekomendasi(10_000_000, 150_000 + i, 70, 60) for i in range(n)]),
+    }
+    results = {}
+    for name, (count, fn) in cases.items():
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - t0)
+        results[name] = count / best
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--latency", type=float, default=0.005, help="jeda tetap per request (detik)")
+    parser.add_argument("--jitter", type=float, default=0.005, help="rata-rata jeda acak tambahan (detik)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_size(args.child, args.latency, args.jitter, args.workers, args.chunk_size)))
+        return
+
+    results = [run_child(n, args) for n in args.sizes]
+    rates = micro()
+    if args.json:
+        print(json.dumps({"sync": results, "micro": rates}, indent=2))
+        return
+
+    print(f"latensi {args.latency * 1000:.1f} ms + jitter {args.jitter * 1000:.1f} ms, {args.workers} worker, "
+          f"{args.chunk_size} pesan/halaman, memori: {results[0]['memory']}")
+    print(f"{'pesan':>8} {'waktu':>9} {'pesan/s':>9} {'p50 hal.':>9} {'p95 hal.':>9} {'puncak':>9} {'+sinkron':>9}")
+    for r in results:
+        print(f"{r['messages']:8d} {r['seconds']:8.2f}s {r['messages_per_second']:9.0f} "
+              f"{r['page_p50'] * 1000:7.1f}ms {r['page_p95'] * 1000:7.1f}ms "
+              f"{r['peak_bytes'] / 2**20:7.0f}MB {r['sync_bytes'] / 2**20:7.0f}MB")
+    print("\nmicro-benchmark (per detik):")
+    for name, rate in rates.items():
+        print(f"  {name:<28} {rate:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
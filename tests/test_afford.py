@@ -0,0 +1,39 @@
+import pytest
+
+from afford import MAX_BULAN, MILESTONE, bulan_mencapai, laju_bulanan, saldo_bulan, simulasi_tabungan, target_bulan
+
+
+def _brute_force(saldo_awal, setoran, target, bunga, inflasi):
+    for bulan in range(MAX_BULAN + 1):
+        if saldo_bulan(saldo_awal, setoran, bulan, bunga) >= target_bulan(target, bulan, inflasi):
+            return bulan
+    return None
+
+
+@pytest.mark.parametrize("saldo_awal, setoran, target", [
+    (0, 100, 1000),
+    (0, 300, 1000),
+    (250, 100, 1000),
+    (1_000_000, 750_000, 15_000_000),
+    (5_000_000, 0, 15_000_000),
+    (20_000_000, 500_000, 15_000_000),
+])
+@pytest.mark.parametrize("bunga_tahunan, inflasi_tahunan", [(0, 0), (5, 0), (0, 3), (4, 6), (12, 2)])
+def test_bulan_mencapai_matches_brute_force(saldo_awal, setoran, target, bunga_tahunan, inflasi_tahunan):
+    bunga, inflasi = laju_bulanan(bunga_tahunan), laju_bulanan(inflasi_tahunan)
+    for porsi in MILESTONE:
+        bulan = bulan_mencapai(saldo_awal, setoran, target * porsi, bunga, inflasi)
+        assert bulan == _brute_force(saldo_awal, setoran, target * porsi, bunga, inflasi)
+        assert bulan is None or type(bulan) is int
+
+
+def test_milestone_months_are_int():
+    simulasi = simulasi_tabungan(0, 100, 1000)
+    assert simulasi["bulan"] == 10
+    assert [(porsi, bulan) for porsi, bulan, _ in simulasi["milestone"]] == [(0.25, 3), (0.5, 5), (0.75, 8), (1.0, 10)]
+    assert all(type(bulan) is int for _, bulan, _ in simulasi["milestone"])
+
+
+def test_unreachable_target():
+    # Harga naik lebih cepat dari bunga dan setoran kecil
+    assert simulasi_tabungan(0, 1, 10_000_000, inflasi_tahunan=10)["bulan"] is None
@@ -0,0 +1,54 @@
+from datetime import date
+
+import pytest
+
+from benchmarks.check_extraction import sample_messages
+from benchmarks.corpus import generate_corpus
+from tracker.batch import parse_messages
+from tracker.parsing import extract_email_text, parse_message
+
+# (nominal, tipe, kanal, pihak) yang benar untuk setiap contoh di check_extraction
+EXPECTED = {
+    "html": (45000, "Pengeluaran", "QRIS", "KOPI KENANGAN"),
+    "plain": (1250000, "Pendapatan", "Transfer", "BUDI SANTOSO"),
+    "alternative": (2500000, "Pengeluaran", "Transfer", ""),
+    "html-only": (100000, "Pengeluaran", "Top-up", "GOPAY"),
+    "nested": (7500000, "Pendapatan", "Transfer", "PT MAJU"),
+}
+
+
+def _summary(trx):
+    return None if trx is None else (round(trx["amount"]), trx["tipe"], trx["kanal"], trx["pihak"])
+
+
+@pytest.mark.parametrize("msg", sample_messages(), ids=lambda msg: msg["id"])
+def test_parse_message(msg):
+    assert _summary(parse_message(msg)) == EXPECTED[msg["id"]]
+
+
+def test_batch_matches_expected():
+    df = parse_messages(sample_messages())
+    assert {msg_id: _summary(row) for msg_id, row in df.iterrows()} == EXPECTED
+
+
+@pytest.mark.parametrize("msg", sample_messages(), ids=lambda msg: msg["id"])
+def test_soup_mode_agrees(msg):
+    pytest.importorskip("bs4")
+    soup = parse_message(msg, extract_mode="soup")
+    expected = EXPECTED[msg["id"]]
+    # Jalur lama tidak membaca bagian bersarang; jika ia menemukan transaksi, nominal & tipe harus sama
+    if soup is not None:
+        assert (round(soup["amount"]), soup["tipe"]) == expected[:2]
+
+
+def test_html_text_drops_markup():
+    text = extract_email_text(sample_messages()[0])
+    assert "<" not in text and "font-family" not in text and "footer" not in text
+    assert "Pembayaran QRIS berhasil." in text
+
+
+def test_synthetic_corpus_ground_truth():
+    messages, expected = generate_corpus(2000, date(2024, 12, 31), days=60, seed=1)
+    df = parse_messages(messages)
+    found = {msg_id: (int(row["amount"]), row["tipe"]) for msg_id, row in df.iterrows()}
+    assert found == {msg_id: truth for msg_id, truth in expected.items() if truth is not None}
@@ -0,0 +1,65 @@
+import threading
+from datetime import date, datetime, timedelta
+
+from benchmarks.fake_gmail import WIB, FakeGmailService, make_message
+from tracker.fetch import build_query, sync_transactions
+from tracker.store import TransactionStore
+
+MANDIRI = "Livin' by Mandiri <noreply.livin@bankmandiri.co.id>"
+
+
+def _message(msg_id, when, amount):
+    return make_message(msg_id, MANDIRI, when, "Transfer Masuk", f"Dana masuk sebesar Rp {amount}")
+
+
+def test_query_bounds_follow_local_days():
+    query = build_query(["a@b.c"], date(2024, 3, 1), date(2024, 3, 2))
+    start = int(datetime(2024, 3, 1, tzinfo=WIB).timestamp())
+    end = int(datetime(2024, 3, 3, tzinfo=WIB).timestamp())
+    assert query == f"(from:a@b.c) after:{start} before:{end}"
+
+
+def test_sync_covers_whole_local_days(tmp_path):
+    day = date(2024, 3, 1)
+    midnight = datetime(2024, 3, 1, tzinfo=WIB)
+    messages = [
+        _message("pagi", midnight + timedelta(minutes=5), "10.000"),  # sebelum tengah malam waktu Pasifik
+        _message("malam", midnight + timedelta(hours=23, minutes=55), "20.000"),
+        _message("besok", midnight + timedelta(days=1, minutes=5), "40.000"),
+    ]
+    store = TransactionStore(str(tmp_path / "tx.db"))
+    sync_transactions(FakeGmailService(messages), store, ["noreply.livin@bankmandiri.co.id"], day, day,
+                      max_workers=1, today=day + timedelta(days=2))
+
+    df = store.query(["noreply.livin@bankmandiri.co.id"], day, day)
+    assert sorted(df["amount"]) == [10000, 20000]
+    assert store.missing_ranges("noreply.livin@bankmandiri.co.id", day, day) == []
+
+
+def test_fake_reads_query_dates_as_pacific_midnight():
+    # 2024-03-01 10:00 WIB masih 2024-02-29 waktu Pasifik
+    service = FakeGmailService([_message("x", datetime(2024, 3, 1, 10, tzinfo=WIB), "1.000")])
+    result = service.users().messages().list(q="after:2024/03/01").execute()
+    assert "messages" not in result
+
+
+def test_sync_reuses_worker_connections(tmp_path):
+    # Seperti GmailClient.http: satu objek http per thread, dibuat saat pertama dipakai
+    local, created = threading.local(), []
+
+    def http_factory():
+        if not hasattr(local, "http"):
+            local.http = object()
+            created.append(threading.get_ident())
+        return local.http
+
+    day = date(2024, 3, 1)
+    midnight = datetime(2024, 3, 1, tzinfo=WIB)
+    messages = [_message(f"m{i:03d}", midnight + timedelta(minutes=i), "1.000") for i in range(400)]
+    store = TransactionStore(str(tmp_path / "tx.db"))
+    sync_transactions(FakeGmailService(messages), store, ["noreply.livin@bankmandiri.co.id"], day, day,
+                      chunk_size=20, max_workers=4, http_factory=http_factory, today=day + timedelta(days=2))
+
+    assert len(store.query(["noreply.livin@bankmandiri.co.id"], day, day)) == 400
+    # 4 worker + thread utama untuk messages().list, bukan 4 per potongan
+    assert len(created) <= 5
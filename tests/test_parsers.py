@@ -0,0 +1,29 @@
+import pytest
+
+from tracker.parsers import parse_bca, parse_mandiri
+from tracker.parsing import html_to_text
+
+
+@pytest.mark.parametrize("parser, text, pihak", [
+    (parse_bca, "Kepada Yth. Bapak BUDI\nNominal : IDR 1,000.00", ""),
+    (parse_bca, "Nominal : IDR 1,000.00\nKe : ANI", "ANI"),
+    (parse_bca, "Nominal : IDR 1,000.00\nDari BUDI SANTOSO", "BUDI SANTOSO"),
+    (parse_mandiri, "Penerimaan dana\nJumlah : Rp 5.000", ""),
+    (parse_mandiri, "Penerimaan dana\nJumlah : Rp 5.000\nNama Pengirim: SITI", "SITI"),
+])
+def test_party_label_is_whole_word(parser, text, pihak):
+    assert parser("Transfer Masuk", text)["pihak"] == pihak
+
+
+def test_amount_label_is_whole_word():
+    # "Subjumlah" bukan label "jumlah"; nominal berlabel yang utuh tetap diutamakan
+    text = "Subjumlah Rp 9.000\nJumlah : Rp 5.000"
+    assert parse_mandiri("Pembayaran Berhasil", text)["amount"] == 5000
+
+
+def test_html_cells_keep_label_and_value_apart():
+    html = "<table><tr><td>Penerima</td><td>KOPI KENANGAN</td></tr><tr><td>Nominal</td><td>Rp 45.000</td></tr></table>"
+    text = html_to_text(html)
+    assert parse_mandiri("Pembayaran Berhasil", text) == {
+        "amount": 45000.0, "tipe": "Pengeluaran", "kanal": "Lainnya", "pihak": "KOPI KENANGAN",
+    }
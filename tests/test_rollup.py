@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from benchmarks.bench_cache import SENDERS, fill_store
+from tracker.store import TransactionStore
+
+END = date(2024, 12, 31)
+
+
+def _expected(store, senders, start, end, period):
+    """Rollup yang dihitung ulang dari transaksi mentah dengan groupby."""
+    df = store.query(senders, start, end)
+    fmt = "%Y-%m-%d" if period == "day" else "%Y-%m"
+    grouped = df.groupby([df["tanggal"].dt.strftime(fmt).rename("periode"), df["tipe"].astype(str)])["amount"]
+    return pd.DataFrame({"total": grouped.sum(), "jumlah": grouped.size()}).reset_index()
+
+
+def _actual(store, senders, start, end, period):
+    return store.rollup(senders, start, end, period)[["periode", "tipe", "total", "jumlah"]]
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    store = TransactionStore(str(tmp_path_factory.mktemp("rollup") / "tx.db"))
+    fill_store(store, END, 430, 3)
+    return store
+
+
+@pytest.mark.parametrize("senders", [list(SENDERS), ["bca@bca.co.id"]])
+@pytest.mark.parametrize("period, start, end", [
+    ("day", END - timedelta(days=29), END),
+    ("month", END - timedelta(days=364), END),        # bulan tepi terpotong di awal
+    ("month", date(2024, 2, 1), date(2024, 11, 30)),  # bulan utuh saja
+    ("month", date(2024, 6, 10), date(2024, 6, 20)),  # di dalam satu bulan
+    ("month", date(2023, 11, 15), date(2024, 1, 10)),  # melewati pergantian tahun
+])
+def test_rollup_matches_groupby(store, senders, period, start, end):
+    expected = _expected(store, senders, start, end, period)
+    pd.testing.assert_frame_equal(_actual(store, senders, start, end, period), expected, check_dtype=False)
+
+
+def test_rollup_follows_updates_and_replace(tmp_path):
+    store = TransactionStore(str(tmp_path / "tx.db"))
+    fill_store(store, END, 40, 2)
+    mandiri = "noreply.livin@bankmandiri.co.id"
+    # Id mengikuti skema fill_store: 3 huruf awal nama pengirim, hari, urutan
+    ids = [f"{SENDERS[mandiri][:3]}-{END.isoformat()}-{i}" for i in range(2)]
+    rows = store.query([mandiri], END, END).set_axis(ids)
+    # Upsert id yang sama (trigger UPDATE) dengan tipe tetap, agar baris rollup-nya tidak hilang oleh HAVING
+    store.add(ids[1:], rows.iloc[1:].assign(amount=777_000))
+    # Parse ulang (DELETE + INSERT) yang memindahkan transaksi ke tipe lain
+    store.replace(ids[:1], rows.iloc[:1].assign(amount=123_000, tipe="Pendapatan"))
+
+    assert len(store.query([mandiri], END, END)) == 2
+    assert store.known_ids(ids) == set(ids)
+
+    start = END - timedelta(days=39)
+    for period in ("day", "month"):
+        expected = _expected(store, list(SENDERS), start, END, period)
+        pd.testing.assert_frame_equal(_actual(store, list(SENDERS), start, END, period), expected, check_dtype=False)
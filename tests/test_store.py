@@ -0,0 +1,89 @@
+import sqlite3
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+from tracker.cache import DayCache
+from tracker.store import TransactionStore
+
+SENDER = "bca@bca.co.id"
+DAY = date(2024, 3, 1)
+
+
+def _transactions(amounts):
+    index = pd.Index([f"m{i}" for i in range(len(amounts))], name="id")
+    return pd.DataFrame({
+        "tanggal": [datetime(2024, 3, 1, 9 + i) for i in range(len(amounts))],
+        "tipe": "Pengeluaran",
+        "amount": amounts,
+        "pengirim": f"BCA <{SENDER}>",
+        "kanal": "QRIS",
+        "pihak": "",
+    }, index=index)
+
+
+def test_query_sees_writes_from_other_store_instances(tmp_path):
+    path = str(tmp_path / "tx.db")
+    app = TransactionStore(path)
+    app.add(["m0", "m1"], _transactions([1000, 2000]))
+    assert sorted(app.query([SENDER], DAY, DAY)["amount"]) == [1000, 2000]
+
+    # Instance terpisah meniru ``python -m tracker.reparse`` di proses lain
+    TransactionStore(path).replace(["m0", "m1"], _transactions([5000, 7000]))
+
+    assert sorted(app.query([SENDER], DAY, DAY)["amount"]) == [5000, 7000]
+    assert app.rollup([SENDER], DAY, DAY)["total"].sum() == 12000
+
+
+def test_own_writes_only_invalidate_their_days(tmp_path):
+    store = TransactionStore(str(tmp_path / "tx.db"))
+    store.add(["m0"], _transactions([1000]))
+    store.query([SENDER], date(2024, 2, 1), DAY)
+    buckets = store.cache.stats()["buckets"]
+    store.add(["m1"], _transactions([1000, 2000]).iloc[1:])
+    assert store.cache.stats()["buckets"] == buckets - 1
+    assert sorted(store.query([SENDER], DAY, DAY)["amount"]) == [1000, 2000]
+
+
+
+def test_failed_replace_keeps_old_transactions(tmp_path):
+    store = TransactionStore(str(tmp_path / "tx.db"))
+    store.add(["m0", "m1"], _transactions([1000, 2000]))
+    store.query([SENDER], DAY, DAY)
+
+    broken = _transactions([5000, 7000])
+    broken["tipe"] = ["Pengeluaran", None]  # gagal NOT NULL setelah DELETE berjalan
+    with pytest.raises(sqlite3.IntegrityError):
+        store.replace(["m0", "m1"], broken)
+
+    assert sorted(TransactionStore(store.path).query([SENDER], DAY, DAY)["amount"]) == [1000, 2000]
+    assert store.rollup([SENDER], DAY, DAY)["total"].sum() == 3000
+
+
+def test_replace_clears_days_of_deleted_transactions(tmp_path):
+    store = TransactionStore(str(tmp_path / "tx.db"))
+    store.add(["m0"], _transactions([1000]))
+    store.query([SENDER], DAY, DAY)
+    moved = _transactions([1000])
+    moved["tanggal"] = [datetime(2024, 3, 2, 9)]
+    store.replace(["m0"], moved)
+
+    assert store.query([SENDER], DAY, DAY).empty
+    assert store.query([SENDER], date(2024, 3, 2), date(2024, 3, 2))["amount"].tolist() == [1000]
+
+def test_stale_snapshot_is_not_cached():
+    cache = DayCache()
+    cache.sync(1)
+    # Baris dibaca pada generasi 1, lalu penulisan generasi 2 selesai lebih dulu
+    cache.invalidate({(SENDER, "2024-03-01")}, 2)
+    cache.put_many(SENDER, {"2024-03-01": (("lama",),)}, 1)
+    assert cache.get_many(SENDER, ["2024-03-01"]) == ({}, ["2024-03-01"])
+
+
+def test_missed_generation_clears_cache():
+    cache = DayCache()
+    cache.sync(1)
+    cache.put_many(SENDER, {"2024-03-01": (), "2024-03-02": ()}, 1)
+    cache.invalidate({(SENDER, "2024-03-01")}, 3)  # generasi 2 ditulis proses lain
+    assert cache.stats()["buckets"] == 0
@@ -0,0 +1,30 @@
+import json
+
+import pyarrow as pa
+from streamlit.testing.v1 import AppTest
+
+
+def _native_charts():
+    import pandas as pd
+
+    from tracker.ui import render_charts
+
+    rollup = pd.DataFrame({
+        "periode": ["2024-12-01", "2024-12-01", "2024-12-02"],
+        "tipe": ["Pendapatan", "Pengeluaran", "Pengeluaran"],
+        "total": [500000, 20000, 30000],
+        "jumlah": [1, 2, 3],
+    })
+    render_charts(rollup, 500000, 50000, backend="native")
+
+
+def test_native_pie_has_flat_columns():
+    at = AppTest.from_function(_native_charts).run()
+    assert not at.exception
+    pie = at.get("vega_lite_chart")[1].proto
+    encoding = json.loads(pie.spec)["encoding"]
+    data = pa.ipc.open_stream(pie.data.data).read_all().to_pandas()
+
+    # Field yang dipakai spec harus berupa kolom data, bukan satu kolom berisi dict
+    assert {encoding["theta"]["field"], encoding["color"]["field"]} <= set(data.columns)
+    assert dict(zip(data["tipe"], data["jumlah"])) == {"Pendapatan": 1, "Pengeluaran": 5}
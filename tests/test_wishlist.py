@@ -0,0 +1,28 @@
+import io
+
+import pandas as pd
+import pytest
+
+from wishlist import baca_wishlist, nilai_wishlist
+
+
+def _harga(values):
+    csv = "nama,harga,bahagia,penting\n" + "".join(f"b{i},\"{v}\",50,50\n" for i, v in enumerate(values))
+    hasil = nilai_wishlist(baca_wishlist(io.StringIO(csv)), uang_sekarang=10_000_000)
+    return hasil.set_index("nama")["harga"].sort_index().tolist()
+
+
+def test_to_csv_roundtrip_keeps_prices():
+    df = pd.DataFrame({"nama": ["a", "b"], "harga": [1500000.0, 250000.5], "bahagia": [60, 70], "penting": [50, 40]})
+    hasil = nilai_wishlist(baca_wishlist(io.StringIO(df.to_csv(index=False))), uang_sekarang=10_000_000)
+    assert hasil.set_index("nama")["harga"].sort_index().tolist() == [1500000, 250000]  # rupiah utuh, bukan 15.000.000 / 2.500.005
+
+
+def test_rupiah_formats():
+    assert _harga(["750.000", "Rp 1.500.000", "1,250,000.00", "Rp1.500.000,50", "42000"]) == \
+        [750000, 1500000, 1250000, 1500000, 42000]
+
+
+def test_unparseable_price_is_rejected():
+    with pytest.raises(ValueError, match="harga"):
+        _harga(["1.50.00"])
@@ -0,0 +1 @@
+"""Mesin Finance Tracker: ambil dan olah email transaksi bank dari Gmail."""
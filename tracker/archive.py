@@ -0,0 +1,84 @@
+"""Arsip lokal pesan Gmail mentah, terkompresi dan content-addressed.
+
+Setiap pesan (hasil ``messages().get``) disimpan sebagai JSON terkompresi
+zlib di ``objects/<sha256[:2]>/<sha256[2:]>``; ``index.db`` memetakan id
+pesan ke hash isinya. Dengan arsip ini aturan parsing bisa diubah lalu
+dijalankan ulang (``tracker.reparse``) tanpa mengunduh email lagi.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import zlib
+
+DEFAULT_PATH = "archive"
+COMPRESSION_LEVEL = 6
+
+
+def _encode(message):
+    # JSON kanonis agar pesan yang sama selalu menghasilkan hash yang sama
+    return json.dumps(message, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+class MessageArchive:
+    def __init__(self, root=DEFAULT_PATH):
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS messages (id TEXT PRIMARY KEY, digest TEXT NOT NULL)")
+
+    def _connect(self):
+        return sqlite3.connect(os.path.join(self.root, "index.db"))
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+    def _write_object(self, digest, data):
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Tulis ke file sementara lalu rename, supaya pembaca tidak melihat file setengah jadi
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(zlib.compress(data, COMPRESSION_LEVEL))
+        os.replace(tmp, path)
+
+    def _read_object(self, digest):
+        with open(self._object_path(digest), "rb") as f:
+            return json.loads(zlib.decompress(f.read()))
+
+    def put_many(self, messages):
+        rows = []
+        for message in messages:
+            data = _encode(message)
+            digest = hashlib.sha256(data).hexdigest()
+            self._write_object(digest, data)
+            rows.append((message["id"], digest))
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO messages (id, digest) VALUES (?, ?)", rows)
+
+    def _digests(self, message_ids):
+        message_ids = list(message_ids)
+        digests = {}
+        with self._connect() as conn:
+            # Batasi jumlah parameter per query (SQLITE_MAX_VARIABLE_NUMBER)
+            for i in range(0, len(message_ids), 500):
+                chunk = message_ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT id, digest FROM messages WHERE id IN ({placeholders})", chunk)
+                digests.update(rows)
+        return digests
+
+    def get_many(self, message_ids):
+        """``{id: pesan}`` untuk id yang ada di arsip; id lain dilewati."""
+        return {msg_id: self._read_object(digest) for msg_id, digest in self._digests(message_ids).items()}
+
+    def ids(self):
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute("SELECT id FROM messages ORDER BY id")]
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
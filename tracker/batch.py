@@ -0,0 +1,55 @@
+"""Parsing transaksi per batch.
+
+Teks mentah semua pesan dikumpulkan dulu, lalu setiap pesan dijalankan
+lewat parser pengirimnya di ``tracker.parsers`` (satu-satunya tempat aturan
+parsing) dan DataFrame transaksi dibangun sekali untuk seluruh batch.
+"""
+from email.utils import parsedate_to_datetime
+
+import pandas as pd
+
+from tracker.frame import compact, empty_frame, to_local
+from tracker.metrics import METRICS
+from tracker.parsers import get_parser
+from tracker.parsing import EXTRACT_MODE, message_fields
+
+
+def collect_raw(messages, extract_mode=EXTRACT_MODE):
+    """DataFrame teks mentah (id, tanggal, pengirim, subject, text) dari pesan Gmail format full."""
+    rows = []
+    with METRICS.stage("extract"):
+        for txt in messages:
+            sender, date_header, subject, text = message_fields(txt, extract_mode)
+            rows.append((txt["id"], parsedate_to_datetime(date_header), sender, subject, text))
+    METRICS.inc("messages_parsed", len(rows))
+    return pd.DataFrame(rows, columns=["id", "tanggal", "pengirim", "subject", "text"])
+
+
+def parse_batch(raw):
+    """Ubah hasil ``collect_raw`` menjadi DataFrame transaksi (index = id pesan).
+
+    Pesan tanpa nominal yang valid dibuang, sama seperti ``parse_message``.
+    """
+    with METRICS.stage("classify"):
+        fields = [get_parser(sender)(subject, text)
+                  for sender, subject, text in zip(raw["pengirim"], raw["subject"], raw["text"])]
+    found = [f is not None for f in fields]
+    fields = [f for f in fields if f is not None]
+    METRICS.inc("transactions_found", len(fields))
+    if not fields:
+        return empty_frame().set_axis(pd.Index([], name="id"))
+
+    raw = raw[found]
+    with METRICS.stage("build_frame"):
+        return compact(pd.DataFrame({
+            "tanggal": to_local(raw["tanggal"]).to_numpy(),
+            "tipe": [f["tipe"] for f in fields],
+            "amount": [f["amount"] for f in fields],
+            "pengirim": raw["pengirim"].to_numpy(),
+            "kanal": [f["kanal"] for f in fields],
+            "pihak": [f["pihak"] for f in fields],
+        })).set_axis(pd.Index(raw["id"], name="id"))
+
+
+def parse_messages(messages, extract_mode=EXTRACT_MODE):
+    return parse_batch(collect_raw(messages, extract_mode))
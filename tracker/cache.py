@@ -0,0 +1,110 @@
+"""Cache baris transaksi per (pengirim, hari) di memori.
+
+Query dengan rentang tanggal yang bergeser atau pengirim tambahan memakai
+ulang hari yang sudah pernah dibaca; hanya hari yang belum ada yang dibaca
+dari SQLite. Ukuran dibatasi jumlah baris, dan bucket yang paling lama tidak
+dipakai dibuang lebih dulu (LRU).
+
+Isi cache ditandai dengan ``generation`` store (penghitung yang naik di setiap
+penulisan ke SQLite, dari proses mana pun). Generasi yang lebih baru dari
+milik cache berarti ada penulisan yang tidak diketahui, jadi cache dikosongkan.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ROWS = 100_000
+
+
+def _weight(rows):
+    # Hari tanpa transaksi tetap dihitung 1 agar jumlah bucket kosong juga terbatas
+    return max(len(rows), 1)
+
+
+class DayCache:
+    def __init__(self, max_rows=DEFAULT_MAX_ROWS):
+        self.max_rows = max_rows
+        self._buckets = OrderedDict()  # (sender_email, "YYYY-MM-DD") -> tuple baris
+        self._size = 0
+        # Store (dan cache ini) dipakai bersama oleh semua sesi Streamlit
+        self._lock = threading.Lock()
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _reset(self, generation):
+        self._buckets.clear()
+        self._size = 0
+        self.generation = generation
+
+    def sync(self, generation):
+        """Kosongkan cache jika store sudah ditulis sampai ``generation`` yang lebih baru."""
+        with self._lock:
+            if self.generation is None or generation > self.generation:
+                self._reset(generation)
+
+    def get_many(self, sender, days):
+        """Bucket ``days`` milik ``sender`` yang ada di cache, dan daftar hari yang belum ada."""
+        found, missing = {}, []
+        with self._lock:
+            for day in days:
+                key = (sender, day)
+                rows = self._buckets.get(key)
+                if rows is None:
+                    missing.append(day)
+                else:
+                    self._buckets.move_to_end(key)
+                    found[day] = rows
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def put_many(self, sender, buckets, generation=None):
+        """Simpan bucket hasil baca store; dilewati jika dibaca dari snapshot ``generation`` yang sudah usang."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            for day, rows in buckets.items():
+                old = self._buckets.pop((sender, day), None)
+                if old is not None:
+                    self._size -= _weight(old)
+                self._buckets[(sender, day)] = rows
+                self._size += _weight(rows)
+            while self._size > self.max_rows and self._buckets:
+                _, rows = self._buckets.popitem(last=False)
+                self._size -= _weight(rows)
+                self.evictions += 1
+
+    def invalidate(self, keys, generation=None):
+        """Buang bucket ``(sender_email, hari)`` yang isinya berubah oleh penulisan ``generation``.
+
+        Jika ada generasi lain yang terlewat (penulisan dari proses lain),
+        seluruh cache dikosongkan karena bucket yang berubah tidak diketahui.
+        """
+        with self._lock:
+            if generation is not None and self.generation is not None and generation > self.generation:
+                if generation != self.generation + 1:
+                    self._reset(generation)
+                    return
+                self.generation = generation
+            for key in keys:
+                rows = self._buckets.pop(key, None)
+                if rows is not None:
+                    self._size -= _weight(rows)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "buckets": len(self._buckets),
+                "rows": self._size,
+            }
@@ -0,0 +1,74 @@
+"""Grafik matplotlib untuk halaman Finance Tracker.
+
+Modul ini hanya di-import saat grafik benar-benar digambar, sehingga
+matplotlib tidak ikut dimuat di halaman lain. Grafik dibuat dengan
+``Figure`` langsung (bukan ``pyplot``), jadi tidak ada figure yang
+tertinggal di registry global; hasilnya dikembalikan sebagai bytes gambar.
+"""
+from io import BytesIO
+
+from matplotlib.figure import Figure
+
+BACKGROUND = "#1f1f1f"  # gelap tapi netral
+FIGSIZE = (4, 3)
+DPI = 100
+IMAGE_FORMAT = "png"  # atau "svg"
+
+
+def _dark_axes():
+    fig = Figure(figsize=FIGSIZE, dpi=DPI)
+    fig.patch.set_facecolor(BACKGROUND)
+    ax = fig.subplots()
+    ax.set_facecolor(BACKGROUND)
+    return fig, ax
+
+
+def _hide_spines(ax):
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+
+def _to_bytes(fig, fmt=IMAGE_FORMAT):
+    buf = BytesIO()
+    try:
+        fig.savefig(buf, format=fmt, facecolor=fig.get_facecolor(), bbox_inches="tight")
+    finally:
+        # Lepas artist dan canvas segera, jangan tunggu garbage collector
+        fig.clear()
+    return buf.getvalue()
+
+
+def income_expense_bar(total_pendapatan, total_pengeluaran, fmt=IMAGE_FORMAT):
+    fig, ax = _dark_axes()
+    ax.bar(['Pendapatan', 'Pengeluaran'], [total_pendapatan, total_pengeluaran], color=["#285A2A", '#621A15'])
+    ax.set_ylabel("Jumlah (Rp)", color='white')
+    ax.set_title("Pendapatan vs Pengeluaran", color='white')
+    ax.tick_params(colors='white', labelsize=10)
+    ax.grid(True, linestyle='--', alpha=0.3, color='white')
+    _hide_spines(ax)
+    return _to_bytes(fig, fmt)
+
+
+def tipe_pie(labels, counts, fmt=IMAGE_FORMAT):
+    fig, ax = _dark_axes()
+    ax.pie(
+        counts, labels=labels, autopct='%1.1f%%', startangle=90,
+        colors=["#621A15", '#285A2A', '#2196F3'],
+        textprops={'color': 'white', 'fontsize': 10}
+    )
+    ax.axis('equal')
+    ax.set_title("Distribusi Tipe Transaksi", color='white')
+    return _to_bytes(fig, fmt)
+
+
+def daily_expense_line(dates, amounts, title="Pengeluaran Harian", fmt=IMAGE_FORMAT):
+    fig, ax = _dark_axes()
+    ax.plot(dates, amounts, marker='o', linestyle='-', color='#621A15', linewidth=2)
+    ax.set_xlabel("Tanggal", color='white')
+    ax.set_ylabel("Jumlah (Rp)", color='white')
+    ax.set_title(title, color='white')
+    ax.tick_params(axis='x', colors='white', rotation=45)
+    ax.tick_params(axis='y', colors='white')
+    ax.grid(True, linestyle='--', alpha=0.3, color='white')
+    _hide_spines(ax)
+    return _to_bytes(fig, fmt)
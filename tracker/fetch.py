@@ -0,0 +1,195 @@
+"""Pengambilan pesan Gmail: paginasi penuh, thread pool terbatas, hasil per potongan."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+
+import pandas as pd
+
+from tracker.batch import parse_messages
+from tracker.frame import LOCAL_TZ, compact, empty_frame
+from tracker.metrics import METRICS
+
+# Jumlah request messages().get yang berjalan bersamaan
+DEFAULT_WORKERS = 8
+# Jumlah id per halaman messages().list (maksimum Gmail 500)
+PAGE_SIZE = 500
+# Jumlah pesan per potongan yang di-yield ke UI
+CHUNK_SIZE = 50
+
+
+def _epoch(day):
+    # Tengah malam ``day`` di LOCAL_TZ dalam detik epoch
+    return int(pd.Timestamp(day).tz_localize(LOCAL_TZ).timestamp())
+
+
+def build_query(selected_senders, start_date, end_date):
+    """Query Gmail untuk [start_date, end_date] menurut hari di ``LOCAL_TZ``.
+
+    Tanggal ``after:YYYY/MM/DD`` dibaca Gmail sebagai tengah malam waktu
+    Pasifik, jadi batas dikirim sebagai detik epoch agar sama dengan hari
+    yang dicatat ``mark_synced``.
+    """
+    query_senders = " OR ".join([f"from:{sender}" for sender in selected_senders])
+    query_dates = f"after:{_epoch(start_date)} before:{_epoch(end_date + timedelta(days=1))}"
+    return f"({query_senders}) {query_dates}"
+
+
+def _execute(request, kind, http=None, scheduler=None):
+    # kind: "list" atau "get", untuk menghitung biaya kuota di scheduler
+    with METRICS.stage(f"gmail_{kind}"):
+        if scheduler is not None:
+            result = scheduler.execute(request, kind, http)
+        else:
+            result = request.execute() if http is None else request.execute(http=http)
+    if kind == "get":
+        METRICS.inc("messages_fetched")
+        METRICS.inc("bytes_fetched", result.get("sizeEstimate", 0))
+    return result
+
+
+@contextmanager
+def worker_pool(max_workers=DEFAULT_WORKERS):
+    """Satu thread pool untuk seluruh sinkronisasi, atau None jika tanpa paralelisme.
+
+    Thread yang sama dipakai ulang antar potongan dan halaman, sehingga
+    koneksi http per thread (``GmailClient.http``) juga tidak dibuat ulang.
+    """
+    if max_workers <= 1:
+        yield None
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        yield pool
+
+
+def fetch_messages(service, message_ids, max_workers=DEFAULT_WORKERS, http_factory=None, scheduler=None,
+                   pool=None):
+    """Ambil isi pesan untuk setiap id; urutan hasil sama dengan urutan message_ids.
+
+    httplib2 tidak thread-safe, jadi setiap worker memakai objek http sendiri
+    dari ``http_factory`` (jika diberikan) saat memanggil ``execute``. Jika
+    ``scheduler`` (``QuotaScheduler``) diberikan, setiap request mengikuti
+    batas kuotanya dan diulang saat gagal sementara. ``pool`` dari
+    ``worker_pool`` dipakai jika ada; tanpa itu pool sementara dibuat per panggilan.
+    """
+    message_ids = list(message_ids)
+    local = threading.local()
+
+    def fetch_one(msg_id):
+        request = service.users().messages().get(userId='me', id=msg_id)
+        if http_factory is None:
+            return _execute(request, "get", scheduler=scheduler)
+        if not hasattr(local, "http"):
+            local.http = http_factory()
+        return _execute(request, "get", local.http, scheduler)
+
+    if max_workers <= 1 or len(message_ids) <= 1:
+        return [fetch_one(msg_id) for msg_id in message_ids]
+
+    if pool is not None:
+        return list(pool.map(fetch_one, message_ids))
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(message_ids))) as pool:
+        return list(pool.map(fetch_one, message_ids))
+
+
+def iter_message_pages(service, query, page_size=PAGE_SIZE, http_factory=None, scheduler=None):
+    """Ikuti ``nextPageToken`` sampai habis; yield daftar id per halaman."""
+    page_token = None
+    while True:
+        request = service.users().messages().list(
+            userId='me',
+            maxResults=page_size,
+            q=query,
+            pageToken=page_token
+        )
+        results = _execute(request, "list", None if http_factory is None else http_factory(), scheduler)
+        yield [m['id'] for m in results.get('messages', [])]
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def iter_transactions(service, selected_senders, start_date, end_date, chunk_size=CHUNK_SIZE,
+                      max_workers=DEFAULT_WORKERS, http_factory=None, scheduler=None):
+    """Yield DataFrame transaksi per potongan ``chunk_size`` pesan, mengikuti semua halaman."""
+    query = build_query(selected_senders, start_date, end_date)
+    with worker_pool(max_workers) as pool:
+        for page in iter_message_pages(service, query, http_factory=http_factory, scheduler=scheduler):
+            for chunk in _chunks(page, chunk_size):
+                yield parse_messages(fetch_messages(service, chunk, max_workers, http_factory, scheduler, pool))
+
+
+def get_transactions(service, selected_senders, start_date, end_date,
+                     max_workers=DEFAULT_WORKERS, http_factory=None, scheduler=None):
+    chunks = list(iter_transactions(service, selected_senders, start_date, end_date,
+                                    max_workers=max_workers, http_factory=http_factory, scheduler=scheduler))
+    if not chunks:
+        return empty_frame()
+    # Kategori tiap potongan bisa berbeda, jadi skema ringkas diterapkan ulang setelah concat
+    df = compact(pd.concat(chunks, ignore_index=True))
+    return df.sort_values(by="tanggal", ascending=False)
+
+
+def fetch_archived(service, message_ids, archive=None, max_workers=DEFAULT_WORKERS, http_factory=None,
+                   scheduler=None, pool=None):
+    """Seperti ``fetch_messages``, tetapi pesan yang sudah ada di ``archive`` tidak diunduh lagi.
+
+    Pesan yang baru diunduh langsung disimpan ke arsip.
+    """
+    if archive is None:
+        return fetch_messages(service, message_ids, max_workers, http_factory, scheduler, pool)
+    message_ids = list(message_ids)
+    archived = archive.get_many(message_ids)
+    missing = [msg_id for msg_id in message_ids if msg_id not in archived]
+    METRICS.inc("archive_hits", len(archived))
+    METRICS.inc("archive_misses", len(missing))
+    if missing:
+        fetched = fetch_messages(service, missing, max_workers, http_factory, scheduler, pool)
+        archive.put_many(fetched)
+        archived.update(zip(missing, fetched))
+    return [archived[msg_id] for msg_id in message_ids]
+
+
+def iter_sync(service, store, selected_senders, start_date, end_date, chunk_size=CHUNK_SIZE,
+              max_workers=DEFAULT_WORKERS, http_factory=None, today=None, archive=None, scheduler=None):
+    """Sinkronkan ``store`` dengan Gmail, hanya mengambil pesan yang belum tersimpan.
+
+    Hari yang sudah lengkap disinkronkan tidak di-list ulang. Setiap potongan
+    yang selesai disimpan langsung, lalu yield ``(selesai, total)`` berupa jumlah
+    pesan baru yang sudah diproses dan yang ditemukan sejauh ini. Jika
+    ``archive`` (``MessageArchive``) diberikan, pesan mentah ikut diarsipkan.
+
+    Jika sebuah request tetap gagal setelah retry, error diteruskan; potongan
+    yang sudah selesai tetap tersimpan dan rentangnya belum ditandai lengkap,
+    sehingga sinkronisasi berikutnya melanjutkan dari sisa pesan saja.
+    """
+    processed = total = 0
+    with worker_pool(max_workers) as pool:
+        for sender in selected_senders:
+            sender = sender.lower()
+            for range_start, range_end in store.missing_ranges(sender, start_date, end_date):
+                query = build_query([sender], range_start, range_end)
+                for page in iter_message_pages(service, query, http_factory=http_factory, scheduler=scheduler):
+                    known = store.known_ids(page)
+                    new_ids = [msg_id for msg_id in page if msg_id not in known]
+                    total += len(new_ids)
+                    for chunk in _chunks(new_ids, chunk_size):
+                        messages = fetch_archived(service, chunk, archive, max_workers, http_factory, scheduler,
+                                                  pool)
+                        store.add(chunk, parse_messages(messages))
+                        processed += len(chunk)
+                        yield processed, total
+                store.mark_synced(sender, range_start, range_end, today)
+
+
+def sync_transactions(service, store, selected_senders, start_date, end_date, **kwargs):
+    """Versi non-streaming dari ``iter_sync``; mengembalikan jumlah pesan baru."""
+    processed = 0
+    for processed, _ in iter_sync(service, store, selected_senders, start_date, end_date, **kwargs):
+        pass
+    return processed
@@ -0,0 +1,35 @@
+"""Skema ringkas DataFrame transaksi.
+
+``tanggal`` berupa datetime lokal tanpa zona waktu, ``amount`` rupiah int64,
+dan kolom berulang (``tipe``, ``pengirim``, ``kanal``) bertipe kategori.
+Format tampilan (Rp, dd/mm/yyyy) hanya dibuat saat render.
+"""
+import pandas as pd
+
+LOCAL_TZ = "Asia/Jakarta"
+TIPE = pd.CategoricalDtype(["Pendapatan", "Pengeluaran", "Tidak diketahui"])
+COLUMNS = ["tanggal", "tipe", "amount", "pengirim", "kanal", "pihak"]
+
+
+def to_local(tanggal):
+    """Datetime (aware, zona apa pun) menjadi datetime64 lokal ``LOCAL_TZ`` tanpa zona."""
+    return pd.to_datetime(tanggal, utc=True).dt.tz_convert(LOCAL_TZ).dt.tz_localize(None)
+
+
+def compact(df):
+    return pd.DataFrame({
+        "tanggal": df["tanggal"].astype("datetime64[ns]"),
+        "tipe": df["tipe"].astype(TIPE),
+        "amount": df["amount"].round().astype("int64"),
+        "pengirim": df["pengirim"].astype("category"),
+        "kanal": df["kanal"].astype("category"),
+        "pihak": df["pihak"].astype(object),
+    }, index=df.index)
+
+
+def empty_frame():
+    return compact(pd.DataFrame({
+        "tanggal": pd.Series(dtype="datetime64[ns]"),
+        **{column: pd.Series(dtype=object) for column in COLUMNS if column != "tanggal"},
+        "amount": pd.Series(dtype="int64"),
+    }))
@@ -0,0 +1,125 @@
+"""Klien Gmail bersama untuk seluruh proses.
+
+Satu objek service dipakai semua sesi Streamlit. Discovery document dibaca
+dari salinan statis di paket googleapiclient (tanpa request jaringan), dan
+token di-refresh di background sebelum kedaluwarsa sehingga request
+pertama sesi tidak menunggu refresh.
+"""
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import httplib2
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+
+from tracker.metrics import METRICS
+from tracker.ratelimit import QuotaScheduler
+
+SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
+# Refresh token selama ini sebelum waktu kedaluwarsanya
+REFRESH_MARGIN = timedelta(minutes=5)
+
+logger = logging.getLogger(__name__)
+
+
+def _login(secrets_path, token_path):
+    # Alur OAuth lewat browser; jarang dipakai sehingga di-import saat perlu saja
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    flow = InstalledAppFlow.from_client_secrets_file(secrets_path, SCOPES)
+    creds = flow.run_local_server(port=0)
+    with open(token_path, 'w') as token:
+        token.write(creds.to_json())
+    return creds
+
+
+def load_credentials(token_path='token.json', secrets_path='credentials.json', on_reset=None):
+    """Baca token tersimpan, refresh bila kedaluwarsa, atau login ulang.
+
+    ``on_reset`` dipanggil sebelum login ulang karena token rusak atau dicabut.
+    """
+    with METRICS.stage("oauth"):
+        return _load_credentials(token_path, secrets_path, on_reset)
+
+
+def _load_credentials(token_path, secrets_path, on_reset):
+    creds = None
+    try:
+        if os.path.exists(token_path):
+            creds = Credentials.from_authorized_user_file(token_path, SCOPES)
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                with open(token_path, 'w') as token:
+                    token.write(creds.to_json())
+            else:
+                creds = _login(secrets_path, token_path)
+    except Exception:
+        if os.path.exists(token_path):
+            os.remove(token_path)
+        if on_reset is not None:
+            on_reset()
+        creds = _login(secrets_path, token_path)
+
+    return creds
+
+
+def build_service(creds):
+    return build('gmail', 'v1', credentials=creds, static_discovery=True, cache_discovery=False)
+
+
+class GmailClient:
+    def __init__(self, creds, token_path=None, refresh_margin=REFRESH_MARGIN):
+        self.creds = creds
+        self.token_path = token_path
+        self.refresh_margin = refresh_margin
+        self.service = build_service(creds)
+        # Kuota Gmail berlaku per user, jadi semua sesi berbagi satu scheduler
+        self.scheduler = QuotaScheduler()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="gmail-token-refresh", daemon=True)
+        self._refresher.start()
+
+    def http(self):
+        """Objek http milik thread pemanggil; httplib2 tidak aman dipakai bersama antar thread."""
+        if not hasattr(self._local, "http"):
+            self._local.http = AuthorizedHttp(self.creds, http=httplib2.Http())
+        return self._local.http
+
+    def refresh(self):
+        with self._lock, METRICS.stage("token_refresh"):
+            self.creds.refresh(Request())
+            if self.token_path:
+                with open(self.token_path, 'w') as token:
+                    token.write(self.creds.to_json())
+
+    def _seconds_until_refresh(self):
+        if self.creds.expiry is None:
+            return None
+        # google-auth menyimpan expiry sebagai datetime UTC tanpa zona waktu
+        expiry = self.creds.expiry.replace(tzinfo=timezone.utc)
+        return (expiry - self.refresh_margin - datetime.now(timezone.utc)).total_seconds()
+
+    def _refresh_loop(self):
+        while not self._stopped.is_set():
+            wait = self._seconds_until_refresh()
+            if wait is None:
+                return
+            if wait > 0:
+                self._stopped.wait(wait)
+                continue
+            try:
+                self.refresh()
+            except Exception:
+                # Token dicabut atau jaringan putus; request berikutnya akan memunculkan error ke UI
+                logger.exception("Gagal me-refresh token Gmail")
+                self._stopped.wait(60)
+
+    def close(self):
+        self._stopped.set()
@@ -0,0 +1,147 @@
+"""Metrik per tahap pipeline Finance Tracker: waktu, jumlah pesan, byte, cache hit.
+
+Mode dipilih lewat env ``TRACKER_METRICS``:
+
+- ``off``: semua pencatatan dilewati.
+- ``basic`` (default): tahap kasar (per request Gmail, per batch, per render)
+  dan counter. Overhead-nya kecil sehingga aman selalu aktif di produksi.
+- ``detail``: ditambah tahap per pesan (decode base64, HTML ke teks) untuk
+  profiling; lebih mahal.
+
+Hasilnya bisa dibaca lewat ``snapshot()``, diekspor sebagai teks Prometheus
+(``to_prometheus()``) atau ditulis ke log sebagai JSON (``log_snapshot()``).
+"""
+import json
+import logging
+import os
+import threading
+import time
+
+MODES = ("off", "basic", "detail")
+
+logger = logging.getLogger(__name__)
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    def __init__(self, mode="basic"):
+        self._lock = threading.Lock()
+        self._stages = {}  # nama -> [jumlah, total detik, maks detik]
+        self._counters = {}
+        self._collectors = {}
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        if mode not in MODES:
+            raise ValueError(f"mode metrik harus salah satu dari {MODES}, bukan {mode!r}")
+        self.mode = mode
+        self.enabled = mode != "off"
+        self.detailed = mode == "detail"
+
+    def stage(self, name, detail=False):
+        """Context manager pengukur waktu tahap ``name``; ``detail=True`` hanya aktif di mode detail."""
+        if not self.enabled or (detail and not self.detailed):
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def observe(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = [0, 0.0, 0.0]
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+
+    def inc(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def register_collector(self, name, fn):
+        """Daftarkan ``fn() -> dict`` berisi angka (mis. ``DayCache.stats``) untuk ikut di-snapshot."""
+        with self._lock:
+            self._collectors[name] = fn
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def snapshot(self):
+        with self._lock:
+            stages = {
+                name: {"count": count, "seconds": total, "max_seconds": longest}
+                for name, (count, total, longest) in self._stages.items()
+            }
+            counters = dict(self._counters)
+            collectors = dict(self._collectors)
+        return {
+            "mode": self.mode,
+            "stages": stages,
+            "counters": counters,
+            "collectors": {name: fn() for name, fn in collectors.items()},
+        }
+
+    def to_prometheus(self, prefix="tracker"):
+        snap = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_stage_seconds_total Total waktu per tahap pipeline.",
+            f"# TYPE {prefix}_stage_seconds_total counter",
+        ]
+        lines += [f'{prefix}_stage_seconds_total{{stage="{name}"}} {s["seconds"]:.6f}'
+                  for name, s in sorted(snap["stages"].items())]
+        lines += [f"# HELP {prefix}_stage_calls_total Jumlah eksekusi per tahap pipeline.",
+                  f"# TYPE {prefix}_stage_calls_total counter"]
+        lines += [f'{prefix}_stage_calls_total{{stage="{name}"}} {s["count"]}'
+                  for name, s in sorted(snap["stages"].items())]
+        lines += [f"# HELP {prefix}_stage_seconds_max Eksekusi terlama per tahap sejak reset.",
+                  f"# TYPE {prefix}_stage_seconds_max gauge"]
+        lines += [f'{prefix}_stage_seconds_max{{stage="{name}"}} {s["max_seconds"]:.6f}'
+                  for name, s in sorted(snap["stages"].items())]
+        for name, value in sorted(snap["counters"].items()):
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value}"]
+        for collector, values in sorted(snap["collectors"].items()):
+            for key, value in sorted(values.items()):
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines += [f"# TYPE {prefix}_{collector}_{key} gauge", f"{prefix}_{collector}_{key} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def log_snapshot(self, event="metrics"):
+        """Tulis snapshot sebagai satu baris JSON ke logger ``tracker.metrics``."""
+        if self.enabled and logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({"event": event, **self.snapshot()}, default=str))
+
+
+# Satu registry untuk seluruh proses (semua sesi Streamlit)
+METRICS = Metrics(os.environ.get("TRACKER_METRICS", "basic"))
@@ -0,0 +1,132 @@
+"""Registry parser per pengirim email bank.
+
+Setiap parser menerima ``(subject, text)`` dan mengembalikan dict berisi
+``amount``, ``tipe``, ``kanal`` dan ``pihak`` (merchant/lawan transaksi),
+atau None jika email bukan notifikasi transaksi. Semua pola dikompilasi
+sekali saat modul di-import.
+"""
+import re
+from email.utils import parseaddr
+from functools import lru_cache
+
+_NUMBER = r'(\d{1,3}(?:[.,]\d{3})*(?:[.,]\d{2})?)'
+
+AMOUNT_RE = re.compile(r'(?:Rp|IDR)\s*' + _NUMBER, re.IGNORECASE)
+INCOME_RE = re.compile(r'\b(?:masuk|diterima|transfer masuk|deposit|top up)\b')
+EXPENSE_RE = re.compile(r'\b(?:keluar|pembayaran|berhasil dibayar|transfer keluar|purchase|withdrawal|transaction|pembelian|tagihan|transfer berhasil|penarikan|qris|top-up)\b')
+
+# Urutan penting: kanal pertama yang cocok yang dipakai
+CHANNEL_RES = [
+    ("QRIS", re.compile(r'\bqris\b')),
+    ("Virtual Account", re.compile(r'\bvirtual account\b')),
+    ("Top-up", re.compile(r'\btop[- ]?up\b')),
+    ("Tarik Tunai", re.compile(r'\b(?:penarikan|tarik tunai|withdrawal)\b')),
+    ("Transfer", re.compile(r'\b(?:transfer|bi-fast)\b')),
+]
+
+PARSERS = {}
+
+
+def register(*senders):
+    def decorator(parser):
+        for sender in senders:
+            PARSERS[sender.lower()] = parser
+        get_parser.cache_clear()
+        return parser
+    return decorator
+
+
+# Header From hanya sedikit variasinya; parseaddr cukup mahal untuk dipanggil per email
+@lru_cache(maxsize=256)
+def get_parser(sender):
+    return PARSERS.get(parseaddr(sender)[1].lower(), parse_generic)
+
+
+def normalize_amount(amount_str):
+    if "," in amount_str and "." in amount_str and amount_str.find(",") < amount_str.find("."):
+        amount_str = amount_str.replace(",", "")
+    else:
+        amount_str = amount_str.replace(".", "").replace(",", ".")
+    return float(amount_str)
+
+
+def classify(search_text):
+    if INCOME_RE.search(search_text):
+        return "Pendapatan"
+    elif EXPENSE_RE.search(search_text):
+        return "Pengeluaran"
+    return "Tidak diketahui"
+
+
+def detect_channel(search_text):
+    return next((name for name, pattern in CHANNEL_RES if pattern.search(search_text)), "Lainnya")
+
+
+def parse_generic(subject, text):
+    """Aturan lama untuk pengirim yang belum punya parser: cari di seluruh subject+body."""
+    amount_match = AMOUNT_RE.search(text)
+    if not amount_match:
+        return None
+    try:
+        amount = normalize_amount(amount_match.group(1))
+    except ValueError:
+        return None
+
+    search_text = (subject + " " + text).lower()
+    return {
+        "amount": amount,
+        "tipe": classify(search_text),
+        "kanal": detect_channel(search_text),
+        "pihak": "",
+    }
+
+
+class LabeledParser:
+    """Parser yang membaca nominal dan lawan transaksi dari baris berlabel.
+
+    Arah transaksi dan kanal ditentukan dari subject dulu; body hanya dipakai
+    jika subject tidak cukup.
+    """
+
+    def __init__(self, amount_labels, party_labels):
+        # Label harus kata utuh: "Kepada" bukan label "ke", "Penerimaan" bukan "penerima"
+        self.amount_re = re.compile(r'\b(?:' + amount_labels + r')\b[ \t]*:?[ \t]*(?:Rp|IDR)\.?\s*' + _NUMBER, re.IGNORECASE)
+        # Nilai dipisah dari label oleh ":" atau spasi
+        self.party_re = re.compile(r'^[ \t]*(?:' + party_labels + r')\b(?:[ \t]*:[ \t]*|[ \t]+)(\S[^\n]*?)[ \t]*$',
+                                   re.IGNORECASE | re.MULTILINE)
+
+    def __call__(self, subject, text):
+        amount_match = self.amount_re.search(text) or AMOUNT_RE.search(text)
+        if not amount_match:
+            return None
+        try:
+            amount = normalize_amount(amount_match.group(1))
+        except ValueError:
+            return None
+
+        subject = subject.lower()
+        tipe = classify(subject)
+        if tipe == "Tidak diketahui":
+            tipe = classify(subject + " " + text.lower())
+        kanal = detect_channel(subject)
+        if kanal == "Lainnya":
+            kanal = detect_channel(text.lower())
+        party_match = self.party_re.search(text)
+
+        return {
+            "amount": amount,
+            "tipe": tipe,
+            "kanal": kanal,
+            "pihak": party_match.group(1) if party_match else "",
+        }
+
+
+parse_mandiri = register("noreply.livin@bankmandiri.co.id")(LabeledParser(
+    amount_labels=r'nominal transaksi|total transaksi|total pembayaran|nominal|jumlah',
+    party_labels=r'nama penerima|penerima|nama merchant|merchant|nama pengirim|pengirim',
+))
+
+parse_bca = register("bca@bca.co.id")(LabeledParser(
+    amount_labels=r'nominal|jumlah|total bayar|total pembayaran',
+    party_labels=r'nama penerima|penerima|nama merchant|merchant|ke|dari',
+))
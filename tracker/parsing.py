@@ -0,0 +1,112 @@
+"""Ekstraksi teks email dan deteksi transaksi dari pesan Gmail."""
+import base64
+import re
+from email.utils import parsedate_to_datetime
+from html import unescape
+
+from tracker.metrics import METRICS
+from tracker.parsers import get_parser
+
+
+# Komentar dan blok script/style dibuang beserta isinya
+_HTML_HIDDEN = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+# Batas sel tabel menjadi spasi dan batas blok menjadi baris baru, supaya "Penerima" dan nilainya
+# di sel berikutnya tetap terpisah seperti di teks plain; tag lain dibuang tanpa jejak
+_HTML_CELL = re.compile(r'<(?:td|th)\b[^>]*>', re.IGNORECASE)
+_HTML_BLOCK = re.compile(r'<(?:br|/?(?:p|div|tr|li|h\d))\b[^>]*>', re.IGNORECASE)
+_HTML_TAG = re.compile(r'<[^>]*>')
+
+# "fast" memakai tokenizer regex; "soup" adalah jalur BeautifulSoup lama sebagai pembanding
+EXTRACT_MODE = "fast"
+
+
+def _decode(data):
+    with METRICS.stage("base64_decode", detail=True):
+        return base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+
+
+def html_to_text(html):
+    with METRICS.stage("html_to_text", detail=True):
+        html = _HTML_BLOCK.sub('\n', _HTML_CELL.sub(' ', _HTML_HIDDEN.sub('', html)))
+        return unescape(_HTML_TAG.sub('', html))
+
+
+def _leaf_parts(payload):
+    parts = payload.get("parts")
+    if not parts:
+        yield payload
+        return
+    for part in parts:
+        yield from _leaf_parts(part)
+
+
+def _extract_email_text_soup(msg):
+    from bs4 import BeautifulSoup
+
+    parts = msg.get("payload", {}).get("parts", [])
+    text = ""
+    if not parts:
+        data = msg['payload']['body'].get('data', '')
+        text = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+    else:
+        for part in parts:
+            if part.get("mimeType") == "text/plain":
+                data = part['body'].get('data', '')
+                text += base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+            elif part.get("mimeType") == "text/html":
+                data = part['body'].get('data', '')
+                html = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+                soup = BeautifulSoup(html, "html.parser")
+                text += soup.get_text()
+    return text
+
+
+def extract_email_text(msg, mode=EXTRACT_MODE):
+    """Teks email; bagian text/plain diutamakan, HTML hanya dipakai jika tidak ada plain."""
+    if mode == "soup":
+        return _extract_email_text_soup(msg)
+
+    payload = msg.get("payload", {})
+    plain, html = [], []
+    for part in _leaf_parts(payload):
+        data = part.get("body", {}).get("data")
+        if not data:
+            continue
+        mime_type = part.get("mimeType", "")
+        if mime_type == "text/html":
+            html.append(part)
+        elif mime_type == "text/plain" or part is payload:
+            plain.append(part)
+
+    if plain:
+        return "".join(_decode(part["body"]["data"]) for part in plain)
+    return "".join(html_to_text(_decode(part["body"]["data"])) for part in html)
+
+
+def message_fields(txt, extract_mode=EXTRACT_MODE):
+    """Ambil ``(pengirim, header Date, subject, teks body)`` dari pesan Gmail format full."""
+    headers = txt.get("payload", {}).get("headers", [])
+    sender = next((h["value"] for h in headers if h["name"].lower()=="from"), "")
+    date_header = next((h["value"] for h in headers if h["name"].lower()=="date"), "")
+    subject = next((h["value"] for h in headers if h["name"].lower()=="subject"), "")
+
+    text = extract_email_text(txt, extract_mode).replace("\xa0", " ").replace("\t", " ")
+    return sender, date_header, subject, text
+
+
+def parse_message(txt, extract_mode=EXTRACT_MODE):
+    """Ubah satu pesan Gmail (format full) menjadi dict transaksi, atau None jika bukan transaksi."""
+    sender, date_header, subject, text = message_fields(txt, extract_mode)
+
+    fields = get_parser(sender)(subject, text)
+    if fields is None:
+        return None
+
+    return {
+        "tanggal": parsedate_to_datetime(date_header),
+        "tipe": fields["tipe"],
+        "amount": fields["amount"],
+        "pengirim": sender,
+        "kanal": fields["kanal"],
+        "pihak": fields["pihak"],
+    }
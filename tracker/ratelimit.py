@@ -0,0 +1,129 @@
+"""Penjadwal request Gmail yang sadar kuota: token bucket adaptif + retry.
+
+Gmail membatasi pemakaian per user dalam *quota unit* per detik, dan setiap
+method punya biaya berbeda. Semua ``execute`` lewat ``QuotaScheduler``
+sehingga laju unit dijaga sedikit di bawah batas. Jika tetap kena 429/403
+``rateLimitExceeded`` laju diturunkan (lalu naik pelan-pelan lagi), dan
+request yang gagal sementara (rate limit, 5xx, koneksi) diulang dengan
+exponential backoff + jitter.
+"""
+import json
+import random
+import threading
+import time
+
+from googleapiclient.errors import HttpError
+
+from tracker.metrics import METRICS
+
+# Batas kuota Gmail per user dan biaya per method (unit)
+QUOTA_PER_SECOND = 250
+QUOTA_COSTS = {"list": 5, "get": 5}
+# Target laju sebagai porsi dari batas, dan burst maksimum dalam detik laju
+SAFETY = 0.9
+BURST_SECONDS = 0.1
+# Penyesuaian laju (AIMD): turun x0.5 saat kena limit, naik 2% batas per request sukses
+DECREASE = 0.5
+INCREASE = 0.02
+MIN_FRACTION = 0.05
+MAX_RETRIES = 6
+BASE_DELAY = 0.5
+MAX_DELAY = 32.0
+
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded", "quotaExceeded"}
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _reasons(error):
+    try:
+        details = json.loads(error.content.decode("utf-8"))["error"].get("errors", [])
+    except (ValueError, KeyError, AttributeError, TypeError):
+        return set()
+    return {d.get("reason") for d in details}
+
+
+def is_rate_limited(error):
+    status = error.resp.status
+    return status == 429 or (status == 403 and bool(_reasons(error) & RATE_LIMIT_REASONS))
+
+
+def is_retryable(error):
+    if isinstance(error, HttpError):
+        return error.resp.status in RETRY_STATUS or is_rate_limited(error)
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+class QuotaScheduler:
+    def __init__(self, units_per_second=QUOTA_PER_SECOND, costs=QUOTA_COSTS, max_retries=MAX_RETRIES,
+                 base_delay=BASE_DELAY, max_delay=MAX_DELAY, sleep=time.sleep, clock=time.monotonic):
+        self.ceiling = units_per_second * SAFETY
+        self.rate = self.ceiling
+        self.costs = dict(costs)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self._capacity()
+        self._updated = clock()
+        self.stats = {"calls": 0, "units": 0, "throttled": 0, "retries": 0, "failed": 0}
+
+    def _capacity(self):
+        # Minimal satu request termahal harus muat
+        return max(self.rate * BURST_SECONDS, max(self.costs.values()))
+
+    def _refill(self, now):
+        self._tokens = min(self._capacity(), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, units):
+        """Tunggu sampai ``units`` tersedia di bucket, lalu pakai."""
+        while True:
+            with self._lock:
+                self._refill(self._clock())
+                if self._tokens >= units:
+                    self._tokens -= units
+                    self.stats["units"] += units
+                    return
+                wait = (units - self._tokens) / self.rate
+            METRICS.observe("quota_wait", wait)
+            self._sleep(wait)
+
+    def _on_success(self):
+        with self._lock:
+            self.rate = min(self.ceiling, self.rate + self.ceiling * INCREASE)
+
+    def _on_throttled(self):
+        with self._lock:
+            self.stats["throttled"] += 1
+            self.rate = max(self.ceiling * MIN_FRACTION, self.rate * DECREASE)
+            # Buang sisa token agar request lain di thread berbeda ikut mengerem
+            self._tokens = 0.0
+
+    def backoff(self, attempt):
+        """Full jitter: acak di [0, min(max_delay, base * 2^attempt)]."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def execute(self, request, kind, http=None):
+        """``request.execute`` dengan pembatasan kuota dan retry untuk error sementara."""
+        cost = self.costs[kind]
+        for attempt in range(self.max_retries + 1):
+            self.acquire(cost)
+            with self._lock:
+                self.stats["calls"] += 1
+            try:
+                result = request.execute() if http is None else request.execute(http=http)
+            except (HttpError, ConnectionError, TimeoutError) as e:
+                if not is_retryable(e) or attempt == self.max_retries:
+                    with self._lock:
+                        self.stats["failed"] += 1
+                    raise
+                if isinstance(e, HttpError) and is_rate_limited(e):
+                    self._on_throttled()
+                with self._lock:
+                    self.stats["retries"] += 1
+                self._sleep(self.backoff(attempt))
+                continue
+            self._on_success()
+            return result
@@ -0,0 +1,71 @@
+"""Parse ulang seluruh arsip pesan mentah dengan pipeline parsing saat ini, tanpa Gmail.
+
+Dipakai setelah aturan klasifikasi, ``normalize_amount``, atau parser bank
+berubah::
+
+    python -m tracker.reparse --archive archive --db transactions.db --workers 4
+
+Setiap worker proses membaca dan mem-parse potongan id-nya sendiri langsung
+dari arsip, jadi hanya daftar id dan DataFrame hasil yang dikirim antar proses.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from tracker.archive import DEFAULT_PATH as DEFAULT_ARCHIVE, MessageArchive
+from tracker.batch import parse_messages
+from tracker.store import DEFAULT_PATH as DEFAULT_DB, TransactionStore
+
+# Jumlah pesan per tugas worker
+REPARSE_CHUNK = 500
+
+
+def _parse_ids(root, message_ids):
+    messages = MessageArchive(root).get_many(message_ids)
+    return message_ids, parse_messages([messages[msg_id] for msg_id in message_ids])
+
+
+def iter_reparse(archive, store, workers=None, chunk_size=REPARSE_CHUNK):
+    """Ganti transaksi di ``store`` dengan hasil parse ulang arsip; yield ``(selesai, total)``."""
+    ids = archive.ids()
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    processed = 0
+    # workers=1: parse di proses ini saja (berguna untuk profiling/debug)
+    pool = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    try:
+        mapper = map if pool is None else pool.map
+        for message_ids, transactions in mapper(_parse_ids, repeat(archive.root), chunks):
+            store.replace(message_ids, transactions)
+            processed += len(message_ids)
+            yield processed, len(ids)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def reparse(archive, store, workers=None, chunk_size=REPARSE_CHUNK):
+    """Versi non-streaming dari ``iter_reparse``; mengembalikan jumlah pesan yang diproses."""
+    processed = 0
+    for processed, _ in iter_reparse(archive, store, workers, chunk_size):
+        pass
+    return processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--archive", default=DEFAULT_ARCHIVE)
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=REPARSE_CHUNK)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    processed = reparse(MessageArchive(args.archive), TransactionStore(args.db), args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - t0
+    print(f"{processed} pesan di-parse ulang dalam {elapsed:.1f} s ({processed / max(elapsed, 1e-9):.0f} pesan/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""Penyimpanan lokal (SQLite) untuk transaksi hasil parsing, dikunci dengan id pesan Gmail.
+
+Total harian dan bulanan per pengirim dan tipe disimpan di tabel rollup yang
+diperbarui trigger setiap kali tabel ``transactions`` berubah, sehingga
+ringkasan rentang panjang tidak perlu membaca semua transaksi.
+"""
+import sqlite3
+from datetime import date, timedelta
+from email.utils import parseaddr
+from functools import lru_cache
+
+import pandas as pd
+
+from tracker.cache import DEFAULT_MAX_ROWS, DayCache
+from tracker.frame import LOCAL_TZ, compact
+from tracker.metrics import METRICS
+
+DEFAULT_PATH = "transactions.db"
+ROW_COLUMNS = ["ts", "tipe", "amount", "pengirim", "kanal", "pihak"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id TEXT PRIMARY KEY              -- semua pesan yang sudah diproses, termasuk yang bukan transaksi
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    ts INTEGER NOT NULL,             -- epoch detik (UTC)
+    tanggal TEXT NOT NULL,           -- YYYY-MM-DD di LOCAL_TZ, untuk filter rentang tanggal
+    tipe TEXT NOT NULL,
+    amount INTEGER NOT NULL,         -- rupiah
+    pengirim TEXT NOT NULL,
+    sender_email TEXT NOT NULL,
+    kanal TEXT NOT NULL DEFAULT '',
+    pihak TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_sender_tanggal ON transactions (sender_email, tanggal);
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    sender_email TEXT NOT NULL,
+    tanggal TEXT NOT NULL,           -- YYYY-MM-DD
+    tipe TEXT NOT NULL,
+    total INTEGER NOT NULL,          -- rupiah
+    jumlah INTEGER NOT NULL,         -- banyaknya transaksi
+    PRIMARY KEY (sender_email, tanggal, tipe)
+);
+CREATE TABLE IF NOT EXISTS monthly_rollup (
+    sender_email TEXT NOT NULL,
+    bulan TEXT NOT NULL,             -- YYYY-MM
+    tipe TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    jumlah INTEGER NOT NULL,
+    PRIMARY KEY (sender_email, bulan, tipe)
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+-- Naik di setiap penulisan transaksi, agar cache proses lain tahu isinya usang
+INSERT OR IGNORE INTO store_meta VALUES ('generation', 0);
+CREATE TABLE IF NOT EXISTS sync_state (
+    sender_email TEXT PRIMARY KEY,
+    synced_from TEXT NOT NULL,       -- rentang hari yang sudah lengkap disinkronkan (inklusif)
+    synced_until TEXT NOT NULL
+);
+"""
+
+# Rollup diperbarui di dalam SQLite agar selalu konsisten dengan semua jalur tulis (add, replace)
+ROLLUP_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS rollup_insert AFTER INSERT ON transactions BEGIN
+    INSERT INTO daily_rollup VALUES (NEW.sender_email, NEW.tanggal, NEW.tipe, NEW.amount, 1)
+        ON CONFLICT (sender_email, tanggal, tipe) DO UPDATE SET total = total + excluded.total, jumlah = jumlah + 1;
+    INSERT INTO monthly_rollup VALUES (NEW.sender_email, substr(NEW.tanggal, 1, 7), NEW.tipe, NEW.amount, 1)
+        ON CONFLICT (sender_email, bulan, tipe) DO UPDATE SET total = total + excluded.total, jumlah = jumlah + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS rollup_delete AFTER DELETE ON transactions BEGIN
+    UPDATE daily_rollup SET total = total - OLD.amount, jumlah = jumlah - 1
+        WHERE sender_email = OLD.sender_email AND tanggal = OLD.tanggal AND tipe = OLD.tipe;
+    UPDATE monthly_rollup SET total = total - OLD.amount, jumlah = jumlah - 1
+        WHERE sender_email = OLD.sender_email AND bulan = substr(OLD.tanggal, 1, 7) AND tipe = OLD.tipe;
+END;
+CREATE TRIGGER IF NOT EXISTS rollup_update AFTER UPDATE ON transactions BEGIN
+    UPDATE daily_rollup SET total = total - OLD.amount, jumlah = jumlah - 1
+        WHERE sender_email = OLD.sender_email AND tanggal = OLD.tanggal AND tipe = OLD.tipe;
+    UPDATE monthly_rollup SET total = total - OLD.amount, jumlah = jumlah - 1
+        WHERE sender_email = OLD.sender_email AND bulan = substr(OLD.tanggal, 1, 7) AND tipe = OLD.tipe;
+    INSERT INTO daily_rollup VALUES (NEW.sender_email, NEW.tanggal, NEW.tipe, NEW.amount, 1)
+        ON CONFLICT (sender_email, tanggal, tipe) DO UPDATE SET total = total + excluded.total, jumlah = jumlah + 1;
+    INSERT INTO monthly_rollup VALUES (NEW.sender_email, substr(NEW.tanggal, 1, 7), NEW.tipe, NEW.amount, 1)
+        ON CONFLICT (sender_email, bulan, tipe) DO UPDATE SET total = total + excluded.total, jumlah = jumlah + 1;
+END;
+"""
+
+# Isi awal rollup untuk database yang sudah berisi transaksi sebelum tabel rollup ada
+ROLLUP_BACKFILL = """
+INSERT INTO daily_rollup
+    SELECT sender_email, tanggal, tipe, SUM(amount), COUNT(*) FROM transactions GROUP BY sender_email, tanggal, tipe;
+INSERT INTO monthly_rollup
+    SELECT sender_email, substr(tanggal, 1, 7), tipe, SUM(amount), COUNT(*) FROM transactions
+    GROUP BY sender_email, substr(tanggal, 1, 7), tipe;
+"""
+
+# Kolom yang ditambahkan setelah versi pertama skema, untuk database lama
+MIGRATIONS = {
+    "kanal": "ALTER TABLE transactions ADD COLUMN kanal TEXT NOT NULL DEFAULT ''",
+    "pihak": "ALTER TABLE transactions ADD COLUMN pihak TEXT NOT NULL DEFAULT ''",
+}
+
+
+@lru_cache(maxsize=256)
+def sender_address(sender):
+    return parseaddr(sender)[1].lower()
+
+
+def _day_ranges(days):
+    """Kelompokkan hari ISO yang berurutan menjadi rentang ``(awal, akhir)``."""
+    ranges = []
+    for day in map(date.fromisoformat, days):
+        if ranges and day - ranges[-1][1] == timedelta(days=1):
+            ranges[-1][1] = day
+        else:
+            ranges.append([day, day])
+    return ranges
+
+
+def _month_start(day):
+    return day.replace(day=1)
+
+
+def _next_month(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+class TransactionStore:
+    def __init__(self, path=DEFAULT_PATH, cache_rows=DEFAULT_MAX_ROWS):
+        self.path = path
+        self.cache = DayCache(cache_rows)
+        with self._connect() as conn:
+            had_rollup = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_rollup'"
+            ).fetchone() is not None
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(transactions)")}
+            for column, statement in MIGRATIONS.items():
+                if column not in columns:
+                    conn.execute(statement)
+            if not had_rollup:
+                conn.executescript(ROLLUP_BACKFILL)
+            conn.executescript(ROLLUP_TRIGGERS)
+
+    def _connect(self):
+        return sqlite3.connect(self.path)
+
+    @staticmethod
+    def _generation(conn):
+        return conn.execute("SELECT value FROM store_meta WHERE key = 'generation'").fetchone()[0]
+
+    def _bump_generation(self, conn):
+        # Dipanggil di dalam transaksi tulis, jadi nilainya milik penulisan ini saja
+        conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'generation'")
+        return self._generation(conn)
+
+    def known_ids(self, message_ids):
+        message_ids = list(message_ids)
+        known = set()
+        with self._connect() as conn:
+            # Batasi jumlah parameter per query (SQLITE_MAX_VARIABLE_NUMBER)
+            for i in range(0, len(message_ids), 500):
+                chunk = message_ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT id FROM messages WHERE id IN ({placeholders})", chunk)
+                known.update(row[0] for row in rows)
+        return known
+
+    @staticmethod
+    def _rows(transactions):
+        """Baris tabel ``transactions`` dan kunci ``(sender_email, hari)`` yang disentuhnya."""
+        tanggal = transactions["tanggal"].dt.tz_localize(LOCAL_TZ)
+        # .tolist() agar sqlite3 menerima tipe Python biasa, bukan skalar numpy
+        days = tanggal.dt.strftime("%Y-%m-%d").tolist()
+        senders = transactions["pengirim"].astype(object).map(sender_address).tolist()
+        rows = zip(
+            transactions.index.tolist(),
+            ((tanggal - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)).tolist(),
+            days,
+            transactions["tipe"].tolist(),
+            transactions["amount"].tolist(),
+            transactions["pengirim"].tolist(),
+            senders,
+            transactions["kanal"].tolist(),
+            transactions["pihak"].tolist(),
+        )
+        return rows, set(zip(senders, days))
+
+    def _write(self, conn, message_ids, rows):
+        # Bagian dari transaksi pemanggil; generasi naik bersama perubahan barisnya
+        conn.executemany("INSERT OR IGNORE INTO messages (id) VALUES (?)", [(msg_id,) for msg_id in message_ids])
+        # Upsert (bukan INSERT OR REPLACE) agar trigger UPDATE mengoreksi rollup untuk id yang sama
+        conn.executemany(
+            "INSERT INTO transactions "
+            "(id, ts, tanggal, tipe, amount, pengirim, sender_email, kanal, pihak) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET ts = excluded.ts, tanggal = excluded.tanggal, tipe = excluded.tipe, "
+            "amount = excluded.amount, pengirim = excluded.pengirim, sender_email = excluded.sender_email, "
+            "kanal = excluded.kanal, pihak = excluded.pihak",
+            rows,
+        )
+        return self._bump_generation(conn)
+
+    def add(self, message_ids, transactions):
+        """Tandai ``message_ids`` sudah diproses dan simpan ``transactions`` (hasil ``parse_batch``)."""
+        rows, keys = self._rows(transactions)
+        with METRICS.stage("store_write"), self._connect() as conn:
+            generation = self._write(conn, message_ids, rows)
+        self.cache.invalidate(keys, generation)
+
+    def replace(self, message_ids, transactions):
+        """Seperti ``add``, tetapi transaksi lama milik ``message_ids`` dihapus dulu (untuk parse ulang).
+
+        Hapus dan simpan ulang terjadi dalam satu transaksi SQLite, jadi pembaca
+        (dan proses yang terhenti di tengah) tidak pernah melihat transaksinya hilang.
+        """
+        message_ids = list(message_ids)
+        rows, _ = self._rows(transactions)
+        with METRICS.stage("store_write"), self._connect() as conn:
+            for i in range(0, len(message_ids), 500):
+                chunk = message_ids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(f"DELETE FROM transactions WHERE id IN ({placeholders})", chunk)
+            generation = self._write(conn, message_ids, rows)
+        # Hari milik transaksi yang dihapus tidak diketahui tanpa query tambahan,
+        # jadi seluruh cache dikosongkan sampai generasi ini
+        self.cache.sync(generation)
+
+    def missing_ranges(self, sender, start_date, end_date):
+        """Rentang hari dalam [start_date, end_date] yang belum disinkronkan untuk ``sender``."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_from, synced_until FROM sync_state WHERE sender_email = ?", (sender,)
+            ).fetchone()
+        if row is None:
+            return [(start_date, end_date)]
+        synced_from, synced_until = date.fromisoformat(row[0]), date.fromisoformat(row[1])
+        if end_date < synced_from or start_date > synced_until:
+            return [(start_date, end_date)]
+        ranges = []
+        if start_date < synced_from:
+            ranges.append((start_date, synced_from - timedelta(days=1)))
+        if end_date > synced_until:
+            ranges.append((synced_until + timedelta(days=1), end_date))
+        return ranges
+
+    def mark_synced(self, sender, start_date, end_date, today=None):
+        # Hari ini belum selesai, jadi tidak dihitung sebagai sudah lengkap
+        today = today or date.today()
+        end_date = min(end_date, today - timedelta(days=1))
+        if end_date < start_date:
+            return
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_from, synced_until FROM sync_state WHERE sender_email = ?", (sender,)
+            ).fetchone()
+            if row is not None:
+                synced_from, synced_until = date.fromisoformat(row[0]), date.fromisoformat(row[1])
+                overlaps = start_date <= synced_until + timedelta(days=1) and end_date >= synced_from - timedelta(days=1)
+                if not overlaps:
+                    # Simpan rentang yang lebih panjang agar cakupan lama tidak hilang percuma
+                    if (synced_until - synced_from) >= (end_date - start_date):
+                        return
+                else:
+                    start_date, end_date = min(start_date, synced_from), max(end_date, synced_until)
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (sender, start_date.isoformat(), end_date.isoformat()),
+            )
+
+    def _load_days(self, conn, sender, first, last):
+        """Baca transaksi ``sender`` untuk setiap hari di [first, last] sebagai bucket per hari."""
+        buckets = {(first + timedelta(days=i)).isoformat(): [] for i in range((last - first).days + 1)}
+        with METRICS.stage("store_read"):
+            rows = conn.execute(
+                "SELECT tanggal, ts, tipe, amount, pengirim, kanal, pihak FROM transactions "
+                "WHERE sender_email = ? AND tanggal BETWEEN ? AND ?",
+                (sender, first.isoformat(), last.isoformat()),
+            )
+            for row in rows:
+                buckets[row[0]].append(row[1:])
+        return {day: tuple(day_rows) for day, day_rows in buckets.items()}
+
+    def query(self, selected_senders, start_date, end_date):
+        """Transaksi ``selected_senders`` dalam [start_date, end_date], terbaru dulu.
+
+        Hari yang sudah ada di ``self.cache`` tidak dibaca ulang dari SQLite.
+        Cache dikosongkan dulu jika store ditulis proses lain (mis. ``tracker.reparse``).
+        """
+        days = [(start_date + timedelta(days=i)).isoformat() for i in range((end_date - start_date).days + 1)]
+        rows = []
+        with self._connect() as conn:
+            # Generasi dan baris dibaca dari snapshot yang sama; bucket dari snapshot yang
+            # sudah didahului penulisan lain tidak masuk cache
+            conn.execute("BEGIN")
+            generation = self._generation(conn)
+            self.cache.sync(generation)
+            for sender in dict.fromkeys(s.lower() for s in selected_senders):
+                buckets, missing = self.cache.get_many(sender, days)
+                for first, last in _day_ranges(missing):
+                    loaded = self._load_days(conn, sender, first, last)
+                    self.cache.put_many(sender, loaded, generation)
+                    buckets.update(loaded)
+                for day in days:
+                    rows.extend(buckets[day])
+        with METRICS.stage("query_frame"):
+            df = pd.DataFrame.from_records(rows, columns=ROW_COLUMNS)
+            df = df.sort_values("ts", ascending=False, kind="stable", ignore_index=True)
+            return compact(pd.DataFrame({
+                "tanggal": pd.to_datetime(df["ts"], unit="s", utc=True).dt.tz_convert(LOCAL_TZ).dt.tz_localize(None),
+                "tipe": df["tipe"],
+                "amount": df["amount"],
+                "pengirim": df["pengirim"],
+                "kanal": df["kanal"],
+                "pihak": df["pihak"],
+            }))
+
+    def rollup(self, selected_senders, start_date, end_date, period="day"):
+        """Total rupiah dan jumlah transaksi per periode dan tipe dari tabel rollup.
+
+        ``period`` "day" menghasilkan ``periode`` YYYY-MM-DD, "month" YYYY-MM.
+        Untuk "month", bulan yang utuh di dalam rentang dibaca dari
+        ``monthly_rollup`` dan hanya bulan tepi yang terpotong dari
+        ``daily_rollup``, jadi biayanya sebanding jumlah bulan, bukan transaksi.
+        """
+        senders = list(dict.fromkeys(s.lower() for s in selected_senders))
+        placeholders = ",".join("?" * len(senders))
+        if period == "day":
+            sql = (f"SELECT tanggal AS periode, tipe, total, jumlah FROM daily_rollup "
+                   f"WHERE sender_email IN ({placeholders}) AND tanggal BETWEEN ? AND ?")
+            params = [*senders, start_date.isoformat(), end_date.isoformat()]
+        elif period == "month":
+            full_start = start_date if start_date.day == 1 else _next_month(start_date)
+            full_end = end_date if _next_month(end_date) - timedelta(days=1) == end_date \
+                else _month_start(end_date) - timedelta(days=1)
+            parts, params = [], []
+            if full_start <= full_end:
+                parts.append(f"SELECT bulan AS periode, tipe, total, jumlah FROM monthly_rollup "
+                             f"WHERE sender_email IN ({placeholders}) AND bulan BETWEEN ? AND ?")
+                params += [*senders, full_start.isoformat()[:7], full_end.isoformat()[:7]]
+                edges = [(start_date, full_start - timedelta(days=1)), (full_end + timedelta(days=1), end_date)]
+            else:
+                edges = [(start_date, end_date)]
+            for first, last in edges:
+                if first <= last:
+                    parts.append(f"SELECT substr(tanggal, 1, 7) AS periode, tipe, total, jumlah FROM daily_rollup "
+                                 f"WHERE sender_email IN ({placeholders}) AND tanggal BETWEEN ? AND ?")
+                    params += [*senders, first.isoformat(), last.isoformat()]
+            sql = " UNION ALL ".join(parts)
+        else:
+            raise ValueError(f"period harus 'day' atau 'month', bukan {period!r}")
+        with METRICS.stage("store_rollup"), self._connect() as conn:
+            df = pd.read_sql_query(
+                f"SELECT periode, tipe, SUM(total) AS total, SUM(jumlah) AS jumlah FROM ({sql}) "
+                f"GROUP BY periode, tipe HAVING SUM(jumlah) > 0 ORDER BY periode",
+                conn,
+                params=params,
+            )
+        return df.astype({"total": "int64", "jumlah": "int64"})
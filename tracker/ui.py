@@ -0,0 +1,209 @@
+"""Komponen tampilan Streamlit untuk halaman Finance Tracker.
+
+Tabel memakai transaksi mentah; ringkasan dan grafik memakai rollup dari
+``TransactionStore.rollup`` (kolom periode, tipe, total, jumlah).
+"""
+import json
+from datetime import date
+
+import streamlit as st
+
+from tracker.metrics import METRICS
+
+TABLE_MAX_ROWS = 2000  # baris terbaru yang ditampilkan; Styler merender semua sel ke HTML
+PREVIEW_ROWS = 200  # baris terbaru di pratinjau selama sinkronisasi
+
+
+def format_rupiah(amount):
+    return f"Rp {amount:,.0f}".replace(",", ".")
+
+
+def color_tipe(val):
+    if val == "Pendapatan":
+        return "color: green"
+    elif val == "Pengeluaran":
+        return "color: red"
+    return ""
+
+
+def render_table(df):
+    with METRICS.stage("render_table"):
+        _render_table(df)
+
+
+def _render_table(df):
+    total_rows = len(df)
+    # Format Rp dan tanggal hanya dibuat oleh Styler saat render, data tetap ringkas
+    df = df.head(TABLE_MAX_ROWS)[['tanggal','tipe','amount','kanal','pihak','pengirim']].rename(columns={'amount': 'jumlah transaksi'})
+    styled_df = df.style \
+        .format({'tanggal': lambda d: d.strftime('%d/%m/%Y'), 'jumlah transaksi': format_rupiah}) \
+        .applymap(color_tipe, subset=['tipe']) \
+        .set_table_styles([{'selector': 'th','props': [('text-align', 'center'),('font-weight', 'bold')]}])
+
+    st.subheader("📊 Data Transaksi")
+    if total_rows > TABLE_MAX_ROWS:
+        st.caption(f"Menampilkan {TABLE_MAX_ROWS:,} transaksi terbaru dari {total_rows:,}.".replace(",", "."))
+    st.dataframe(styled_df, use_container_width=True)
+
+
+def render_preview(df):
+    """Tabel sementara selama sinkronisasi: baris terbaru tanpa Styler, jauh lebih murah dari ``render_table``."""
+    with METRICS.stage("render_preview"):
+        st.subheader("📊 Data Transaksi")
+        st.caption(f"Sinkronisasi berjalan: {len(df):,} transaksi sejauh ini, "
+                   f"menampilkan {min(len(df), PREVIEW_ROWS):,} terbaru.".replace(",", "."))
+        st.dataframe(df.head(PREVIEW_ROWS)[['tanggal', 'tipe', 'amount', 'kanal', 'pihak', 'pengirim']],
+                     use_container_width=True, hide_index=True)
+
+
+def _per_tipe(rollup):
+    return rollup.groupby('tipe')[['total', 'jumlah']].sum()
+
+
+def render_summary(rollup):
+    st.subheader("Ringkasan Keuangan")
+    per_tipe = _per_tipe(rollup)['total']
+    total_pendapatan = int(per_tipe.get("Pendapatan", 0))
+    total_pengeluaran = int(per_tipe.get("Pengeluaran", 0))
+    saldo = total_pendapatan - total_pengeluaran
+
+    # Tampilkan dalam 3 kolom sejajar
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Pendapatan", format_rupiah(total_pendapatan))
+    col2.metric("Total Pengeluaran", format_rupiah(total_pengeluaran))
+    col3.metric("Saldo", format_rupiah(saldo))
+    return total_pendapatan, total_pengeluaran
+
+
+CHART_BACKENDS = ("matplotlib", "native")
+CHART_CACHE_ENTRIES = 256  # jumlah gambar grafik yang disimpan di memori server
+
+
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES, show_spinner=False)
+def chart_image(kind, *aggregates):
+    """Bytes gambar grafik, di-cache berdasarkan hash data agregatnya.
+
+    Filter yang sama menghasilkan agregat yang sama, jadi tampilan ulang
+    tidak menggambar apa pun lagi.
+    """
+    # matplotlib baru dimuat di sini, saat ada grafik yang belum pernah digambar
+    from tracker import charts
+
+    METRICS.inc("chart_draws")
+    with METRICS.stage("chart_draw"):
+        return getattr(charts, kind)(*aggregates)
+
+
+def _chart(kind, *aggregates):
+    # chart_requests - chart_draws = gambar yang diambil dari cache
+    METRICS.inc("chart_requests")
+    _show_image(chart_image(kind, *aggregates))
+
+
+def _show_image(data):
+    from tracker.charts import IMAGE_FORMAT
+
+    if IMAGE_FORMAT == "svg":
+        st.image(data.decode(), use_container_width=True)
+    else:
+        st.image(data, use_container_width=True)
+
+
+def _periode_date(periode):
+    # "YYYY-MM-DD" (harian) atau "YYYY-MM" (bulanan, diwakili tanggal 1)
+    return date.fromisoformat(periode if len(periode) == 10 else f"{periode}-01")
+
+
+def _aggregates(rollup, total_pendapatan, total_pengeluaran):
+    jumlah = _per_tipe(rollup)['jumlah']
+    jumlah = jumlah[jumlah > 0]
+    pengeluaran = rollup[rollup['tipe'] == "Pengeluaran"]
+    # Tuple bilangan/tanggal Python: murah di-hash dan stabil sebagai kunci cache
+    return (
+        (int(total_pendapatan), int(total_pengeluaran)),
+        (tuple(jumlah.index.astype(str)), tuple(jumlah.tolist())),
+        (tuple(map(_periode_date, pengeluaran['periode'])), tuple(pengeluaran['total'].tolist())),
+    )
+
+
+def render_charts(rollup, total_pendapatan, total_pengeluaran, period="day", backend="matplotlib"):
+    if backend not in CHART_BACKENDS:
+        raise ValueError(f"backend grafik tidak dikenal: {backend!r}")
+    bar, pie, daily = _aggregates(rollup, total_pendapatan, total_pengeluaran)
+    judul = "Pengeluaran Harian" if period == "day" else "Pengeluaran Bulanan"
+
+    with METRICS.stage("render_charts"):
+        st.subheader("📈 Grafik Keuangan")
+
+        # Atur kolom supaya ketiga grafik sejajar
+        col1, col2, col3 = st.columns([1, 1, 1])
+
+        # Grafik 1: Bar Pendapatan & Pengeluaran
+        with col1:
+            if backend == "native":
+                st.bar_chart({"Jumlah (Rp)": dict(zip(['Pendapatan', 'Pengeluaran'], bar))}, height=300)
+            else:
+                _chart("income_expense_bar", *bar)
+
+        # Grafik 2: Pie tipe transaksi
+        with col2:
+            if backend == "native":
+                st.vega_lite_chart(
+                    {
+                        "data": {"values": [{"tipe": t, "jumlah": n} for t, n in zip(*pie)]},
+                        "mark": {"type": "arc"},
+                        "encoding": {
+                            "theta": {"field": "jumlah", "type": "quantitative"},
+                            "color": {"field": "tipe", "type": "nominal"},
+                        },
+                    },
+                    use_container_width=True,
+                )
+            else:
+                _chart("tipe_pie", *pie)
+
+        # Grafik 3: Line chart pengeluaran harian (bulanan untuk rentang panjang)
+        with col3:
+            if not daily[0]:
+                st.info("Tidak ada data pengeluaran untuk periode ini.")
+            elif backend == "native":
+                st.line_chart({judul: dict(zip(daily[0], daily[1]))}, height=300)
+            else:
+                _chart("daily_expense_line", *daily, judul)
+
+
+def render_metrics(metrics=METRICS):
+    """Panel debug di sidebar: waktu per tahap, counter, statistik cache/kuota, dan ekspor."""
+    snap = metrics.snapshot()
+    sidebar = st.sidebar
+    sidebar.subheader("🛠️ Metrik Pipeline")
+    sidebar.caption(f"Mode: {snap['mode']} (atur lewat env TRACKER_METRICS: off/basic/detail)")
+
+    stages = sorted(snap["stages"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    if stages:
+        sidebar.dataframe([
+            {
+                "tahap": name,
+                "n": s["count"],
+                "total (ms)": round(s["seconds"] * 1000, 1),
+                "rata-rata (ms)": round(s["seconds"] / s["count"] * 1000, 2),
+                "maks (ms)": round(s["max_seconds"] * 1000, 1),
+            }
+            for name, s in stages
+        ], hide_index=True, use_container_width=True)
+    else:
+        sidebar.caption("Belum ada tahap yang tercatat.")
+    if snap["counters"]:
+        sidebar.dataframe([{"counter": name, "nilai": value} for name, value in sorted(snap["counters"].items())],
+                          hide_index=True, use_container_width=True)
+    for name, values in snap["collectors"].items():
+        sidebar.caption(name)
+        sidebar.json(values, expanded=False)
+
+    sidebar.download_button("⬇️ Prometheus", metrics.to_prometheus(), file_name="tracker_metrics.prom",
+                            mime="text/plain")
+    sidebar.download_button("⬇️ JSON", json.dumps(snap, indent=2, default=str), file_name="tracker_metrics.json",
+                            mime="application/json")
+    if sidebar.button("Reset metrik"):
+        metrics.reset()
+        st.rerun()
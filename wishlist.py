@@ -0,0 +1,101 @@
+"""Evaluasi "Can I Afford" untuk banyak barang sekaligus (wishlist).
+
+Rumus SAW, bobot, dan batas peringatan sama dengan ``afford``, tetapi
+dihitung per kolom dengan pandas/NumPy sehingga ribuan barang dinilai
+dalam satu kali jalan. Bisa dipakai di luar Streamlit::
+
+    from wishlist import baca_wishlist, nilai_wishlist
+    hasil = nilai_wishlist(baca_wishlist("wishlist.csv"), uang_sekarang=25_000_000)
+"""
+import numpy as np
+import pandas as pd
+
+from afford import BATAS_PERINGATAN, BATAS_SKOR, KELIPATAN_TABUNGAN, PESAN_PERINGATAN, normalisasi_bobot
+
+KOLOM_WAJIB = ["harga", "bahagia", "penting"]
+# Pemisah ribuan hanya dibuang jika polanya jelas; "1500000.0" dari to_csv tetap angka desimal
+_RIBUAN_TITIK = r"-?\d{1,3}(?:\.\d{3})+(?:,\d+)?"   # 1.500.000 atau 1.500.000,50
+_RIBUAN_KOMA = r"-?\d{1,3}(?:,\d{3})+(?:\.\d+)?"    # 1,500,000 atau 1,500,000.50
+
+
+def _angka_rupiah(series):
+    """"Rp 1.500.000" / "1,500,000.00" / "1500000.0" / 1500000 -> 1500000; selain itu NaN."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    teks = series.astype(str).str.strip().str.replace(r"^(?:Rp\.?|IDR)\s*", "", regex=True, case=False)
+    titik = teks.str.fullmatch(_RIBUAN_TITIK)
+    koma = teks.str.fullmatch(_RIBUAN_KOMA)
+    teks = teks.mask(titik, teks.str.replace(".", "", regex=False).str.replace(",", ".", regex=False))
+    teks = teks.mask(koma, teks.str.replace(",", "", regex=False))
+    return pd.to_numeric(teks, errors="coerce")
+
+
+def baca_wishlist(sumber):
+    """Baca CSV wishlist (path atau file upload) berkolom harga, bahagia, penting, opsional nama."""
+    # Semua kolom dibaca sebagai teks: "750.000" harus jadi 750000, bukan 750.0
+    df = pd.read_csv(sumber, dtype=str)
+    df.columns = df.columns.str.strip().str.lower()
+    return df
+
+
+def nilai_wishlist(wishlist, uang_sekarang, bobot=None):
+    """Skor SAW, peringkat, peringatan, dan tabungan aman untuk setiap barang.
+
+    ``wishlist`` berupa DataFrame dengan kolom ``harga`` (Rp), ``bahagia`` dan
+    ``penting`` (0–100). Hasilnya diurutkan dari skor tertinggi; kolom
+    ``warn_*`` bernilai True jika kriteria itu memunculkan peringatan.
+    """
+    kurang = [k for k in KOLOM_WAJIB if k not in wishlist.columns]
+    if kurang:
+        raise ValueError(f"kolom wishlist tidak lengkap, kurang: {kurang}")
+    bobot = normalisasi_bobot(bobot)
+
+    harga = _angka_rupiah(wishlist["harga"]).to_numpy(dtype="float64")
+    bahagia = pd.to_numeric(wishlist["bahagia"], errors="coerce").to_numpy(dtype="float64")
+    penting = pd.to_numeric(wishlist["penting"], errors="coerce").to_numpy(dtype="float64")
+    if np.isnan(harga).any() or (harga < 0).any():
+        raise ValueError("harga harus berupa angka rupiah >= 0")
+    for nama, nilai in (("bahagia", bahagia), ("penting", penting)):
+        if np.isnan(nilai).any() or ((nilai < 0) | (nilai > 100)).any():
+            raise ValueError(f"{nama} harus berupa angka 0–100")
+
+    # min(1 / (harga / uang), 1); tanpa uang nilainya 1e-9 seperti saw_rekomendasi
+    if uang_sekarang > 0:
+        with np.errstate(divide="ignore"):
+            n_afford = np.minimum(uang_sekarang / harga, 1.0)
+    else:
+        n_afford = np.full(len(harga), 1e-9)
+    n_bahagia = bahagia / 100
+    n_penting = penting / 100
+    skor = n_afford * bobot["afford"] + n_bahagia * bobot["bahagia"] + n_penting * bobot["penting"]
+    harga = harga.astype("int64")
+
+    nilai = {"afford": n_afford, "bahagia": n_bahagia, "penting": n_penting,
+             "psikologis": (n_bahagia + n_penting) / 2}
+    warn = {f"warn_{k}": nilai[k] < batas for k, batas in BATAS_PERINGATAN.items()}
+
+    # Urutkan sekali lewat argsort, lalu susun hasil langsung dari array yang sudah terurut
+    urutan = np.argsort(-skor, kind="stable")
+    kolom = {"peringkat": np.arange(1, len(urutan) + 1)}
+    for k in wishlist.columns:
+        if k not in KOLOM_WAJIB:
+            kolom[k] = wishlist[k].to_numpy()[urutan]
+    kolom.update({
+        "harga": harga[urutan],
+        "bahagia": bahagia[urutan],
+        "penting": penting[urutan],
+        "n_afford": n_afford[urutan],
+        "n_bahagia": n_bahagia[urutan],
+        "n_penting": n_penting[urutan],
+        "skor": skor[urutan],
+        "layak_beli": skor[urutan] >= BATAS_SKOR,
+        "tabungan_minimal": harga[urutan] * KELIPATAN_TABUNGAN,
+    })
+    kolom.update({k: v[urutan] for k, v in warn.items()})
+    kolom["jumlah_peringatan"] = sum(v.astype("int64") for v in warn.values())[urutan]
+    return pd.DataFrame(kolom)
+
+
+def pesan_peringatan(baris):
+    """Daftar pesan peringatan untuk satu baris hasil ``nilai_wishlist``."""
+    return [PESAN_PERINGATAN[k] for k in BATAS_PERINGATAN if baris[f"warn_{k}"]]